@@ -0,0 +1,17 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id con los parámetros recomendados por OWASP
+    (m=46 MiB, t=2, p=1).
+    
+    Los valores por defecto de Django (100 MiB, p=8) duplican el costo de
+    cada login sin aportar seguridad en un servidor con pocos núcleos.
+    Como Django guarda los parámetros en el hash, si se cambian aquí las
+    contraseñas existentes se re-hashean en el siguiente login.
+    """
+    
+    time_cost = 2
+    memory_cost = 46 * 1024
+    parallelism = 1
@@ -0,0 +1,77 @@
+"""
+Autenticación JWT con caché de tokens ya validados.
+
+Cada request autenticada verifica la firma HMAC del access token y
+decodifica sus claims. Como un mismo token se reutiliza durante toda su
+vida (60 minutos), el resultado de la validación se recuerda unos
+segundos en memoria del proceso.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+_VALIDATED_TOKENS_TTL = getattr(settings, 'JWT_CACHE_TTL', 5)  # segundos
+_VALIDATED_TOKENS_MAXSIZE = getattr(settings, 'JWT_CACHE_MAX', 10000)
+_validated_tokens = OrderedDict()
+_validated_tokens_lock = threading.Lock()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication que evita revalidar un token presentado hace poco.
+    
+    La clave es el SHA-256 del token crudo y la entrada expira a los
+    `JWT_CACHE_TTL` segundos o al vencer el token, lo que ocurra antes.
+    Los tokens inválidos nunca se cachean.
+    """
+    
+    def get_validated_token(self, raw_token):
+        """
+        Retorna el token validado, desde la caché si sigue vigente.
+        
+        Args:
+            raw_token (bytes): El token tal como llegó en el header
+        
+        Returns:
+            Token: El token validado
+        """
+        now = time.time()
+        key = hashlib.sha256(raw_token).digest()
+        
+        with _validated_tokens_lock:
+            entry = _validated_tokens.get(key)
+            if entry is not None:
+                validated_token, expires_at = entry
+                if expires_at > now:
+                    _validated_tokens.move_to_end(key)
+                    return validated_token
+                del _validated_tokens[key]
+        
+        # Lanza InvalidToken si no es válido (y entonces no se cachea)
+        validated_token = super().get_validated_token(raw_token)
+        
+        expires_at = now + _VALIDATED_TOKENS_TTL
+        exp = validated_token.get('exp')
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+        
+        with _validated_tokens_lock:
+            _validated_tokens[key] = (validated_token, expires_at)
+            _validated_tokens.move_to_end(key)
+            if len(_validated_tokens) > _VALIDATED_TOKENS_MAXSIZE:
+                _validated_tokens.popitem(last=False)
+        
+        return validated_token
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """Documenta CachedJWTAuthentication en el schema como jwtAuth."""
+    
+    target_class = 'authentication.jwt_cache.CachedJWTAuthentication'
@@ -0,0 +1,58 @@
+from django.db import IntegrityError, migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_duplicate_emails(apps, schema_editor):
+    """
+    Falla con un mensaje claro si hay emails repetidos sin distinguir mayúsculas.
+
+    Sin esta verificación, CREATE UNIQUE INDEX falla con un error genérico
+    de la base de datos que no indica qué emails hay que corregir.
+    """
+    User = apps.get_model('auth', 'User')
+    duplicates = list(
+        User.objects.using(schema_editor.connection.alias)
+        .exclude(email='')
+        .values(email_lower=Lower('email'))
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .order_by('email_lower')
+        .values_list('email_lower', flat=True)[:20]
+    )
+    if duplicates:
+        raise IntegrityError(
+            "No se puede crear el índice único sobre LOWER(email): hay "
+            "usuarios que comparten email sin distinguir mayúsculas "
+            f"({', '.join(duplicates)}). Unifica o cambia esos emails y "
+            "vuelve a ejecutar la migración."
+        )
+
+
+class Migration(migrations.Migration):
+    """
+    Índice único sobre LOWER(email) en auth_user.
+
+    Garantiza la unicidad del email sin distinguir mayúsculas y respalda la
+    búsqueda por email del registro y del login con un index seek en lugar
+    de un escaneo completo. Es parcial: los usuarios sin email (por ejemplo,
+    creados desde el admin) quedan fuera de él, por eso las consultas
+    excluyen el email vacío.
+    """
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        # Detectar duplicados antes de crear el índice único
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        # Unicidad del email sin distinguir mayúsculas (ignorando emails vacíos)
+        migrations.RunSQL(
+            sql=(
+                "CREATE UNIQUE INDEX auth_user_email_ci_uniq "
+                "ON auth_user (LOWER(email)) WHERE email <> ''"
+            ),
+            reverse_sql="DROP INDEX auth_user_email_ci_uniq",
+        ),
+    ]
@@ -4,103 +4,300 @@ Este módulo contiene todos los serializers necesarios para manejar
 la autenticación de usuarios, registro, login, perfil y cambio de contraseña.
 """
 
+import hashlib
+import hmac
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
 from rest_framework import serializers
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from django.contrib.auth import authenticate
-from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.contrib.auth.password_validation import (
+    get_default_password_validators,
+    password_changed,
+    validate_password,
+)
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 
+# Pool para calcular hashes de contraseñas fuera del hilo de la request.
+# argon2-cffi libera el GIL durante el KDF (cffi lo suelta en cada llamada
+# a C), por lo que el hasheo avanza en paralelo con los validadores y las
+# consultas a la base de datos.
+_PASSWORD_HASHER_POOL = ThreadPoolExecutor(
+    max_workers=4,
+    thread_name_prefix='password-hasher'
+)
+
+
+# Caché en memoria (por proceso) de verificaciones de contraseña exitosas
+# en el login: LRU acotado con expiración corta
+_VERIFIED_PASSWORDS_TTL = 300  # segundos
+_VERIFIED_PASSWORDS_MAXSIZE = 8192
+_verified_passwords = OrderedDict()
+_verified_passwords_lock = threading.Lock()
+
+
+# Tamaño máximo aceptado para una contraseña, en bytes UTF-8
+MAX_PASSWORD_BYTES = 1024
+
+# Estilo compartido por todos los campos de contraseña (solo lectura)
+_PASSWORD_STYLE = MappingProxyType({'input_type': 'password'})
+
+
+def passwords_match(password, other):
+    """Compara dos contraseñas en tiempo constante."""
+    return hmac.compare_digest(password.encode(), other.encode())
+
+
+def normalize_password(password):
+    """Normaliza la contraseña a NFKC, igual que Django hace con el username."""
+    return unicodedata.normalize('NFKC', password)
+
+
+def password_candidates(password):
+    """
+    Formas de una contraseña recibida a probar contra el hash guardado.
+    
+    Primero la forma normalizada; si difiere, también la original para
+    las cuentas cuya contraseña se guardó antes de normalizar.
+    """
+    normalized = normalize_password(password)
+    if normalized == password:
+        return (password,)
+    return (normalized, password)
+
+
+def check_password_cached(user, password):
+    """Verifica la contraseña del usuario recordando los aciertos recientes.
+    
+    Un login repetido con la misma contraseña dentro de
+    `_VERIFIED_PASSWORDS_TTL` segundos evita volver a ejecutar el KDF.
+    La clave incluye el hash almacenado del usuario, por lo que un cambio
+    de contraseña invalida la entrada, y la contraseña solo se guarda como
+    HMAC con SECRET_KEY. Los fallos nunca se cachean.
+    
+    Returns:
+        bool: True si la contraseña es correcta
+    """
+    now = time.monotonic()
+    key = _verified_password_key(user, password)
+    
+    with _verified_passwords_lock:
+        expires_at = _verified_passwords.get(key)
+        if expires_at is not None:
+            if expires_at > now:
+                _verified_passwords.move_to_end(key)
+                return True
+            del _verified_passwords[key]
+    
+    if not user.check_password(password):
+        return False
+    
+    # check_password() puede haber actualizado el hash (cambio de hasher)
+    key = _verified_password_key(user, password)
+    with _verified_passwords_lock:
+        _verified_passwords[key] = now + _VERIFIED_PASSWORDS_TTL
+        _verified_passwords.move_to_end(key)
+        if len(_verified_passwords) > _VERIFIED_PASSWORDS_MAXSIZE:
+            _verified_passwords.popitem(last=False)
+    
+    return True
+
+
+def _verified_password_key(user, password):
+    """Clave de la caché de verificaciones para el usuario y contraseña."""
+    digest = hmac.new(
+        settings.SECRET_KEY.encode(), password.encode(), hashlib.sha256
+    ).digest()
+    return (user.pk, user.password, digest)
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+
+def validate_password_strength(password, field_name, user=None):
+    """Valida la fortaleza de una contraseña con los validadores de Django.
+    
+    Reutiliza las instancias de validadores que Django memoiza por proceso,
+    de modo que la lista de contraseñas comunes se carga una sola vez y no
+    en cada request.
+    
+    Raises:
+        serializers.ValidationError: Con los mensajes asociados a `field_name`
+    """
+    try:
+        validate_password(
+            password,
+            user=user,
+            password_validators=get_default_password_validators()
+        )
+    except ValidationError as e:
+        raise serializers.ValidationError({
+            field_name: list(e.messages)
+        })
+
+
+class PasswordField(serializers.CharField):
+    """
+    Campo de contraseña: solo escritura y renderizado como input password.
+    
+    El estilo se inyecta aquí en lugar de pasarse como argumento, así la
+    copia profunda de los campos que DRF hace en cada instancia del
+    serializer no duplica el diccionario `style`.
+    
+    Rechaza entradas de más de MAX_PASSWORD_BYTES antes de que lleguen a
+    los validadores o al hasher y, salvo `normalize=False`, devuelve la
+    contraseña normalizada a NFKC. Los campos que se comparan contra una
+    contraseña ya guardada usan `normalize=False` y `password_candidates()`.
+    """
+    
+    default_error_messages = {
+        'max_bytes': 'La contraseña no puede superar los {max_bytes} bytes.',
+    }
+    
+    def __init__(self, normalize=True, **kwargs):
+        self.normalize = normalize
+        kwargs.setdefault('write_only', True)
+        kwargs.setdefault('style', _PASSWORD_STYLE)
+        super().__init__(**kwargs)
+    
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if len(value.encode('utf-8')) > MAX_PASSWORD_BYTES:
+            self.fail('max_bytes', max_bytes=MAX_PASSWORD_BYTES)
+        if self.normalize:
+            value = normalize_password(value)
+        return value
+
+
+class UserRegistrationSerializer(serializers.Serializer):
     """Serializer para el registro de nuevos usuarios.
     
     Maneja la creación de nuevos usuarios con validaciones de seguridad
     para email único y contraseña segura.
     """
     
-    password = serializers.CharField(
-        write_only=True,
-        min_length=8,
-        style={'input_type': 'password'},
-        help_text="La contraseña debe tener al menos 8 caracteres"
-    )
-    password_confirm = serializers.CharField(
-        write_only=True,
-        style={'input_type': 'password'},
-        help_text="Confirma tu contraseña"
+    # Serializer plano (no ModelSerializer) para que DRF no introspeccione
+    # el modelo User en cada request; los campos replican auth_user
+    username = serializers.CharField(
+        max_length=150,
+        # La unicidad se verifica en validate() junto con el email
+        validators=[UnicodeUsernameValidator()],
+        help_text='Nombre de usuario único. Solo letras, números y @/./+/-/_ permitidos.'
     )
     email = serializers.EmailField(
         required=True,
+        max_length=254,
         help_text="Email único para el usuario"
     )
-    
-    class Meta:
-        model = User
-        fields = ('username', 'email', 'first_name', 'last_name', 'password', 'password_confirm')
-        extra_kwargs = {
-            'username': {
-                'help_text': 'Nombre de usuario único. Solo letras, números y @/./+/-/_ permitidos.'
-            },
-            'first_name': {
-                'help_text': 'Nombre del usuario'
-            },
-            'last_name': {
-                'help_text': 'Apellido del usuario'
-            }
-        }
-    
-    def validate_email(self, value):
-        """Valida que el email sea único en el sistema."""
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError(
-                "Ya existe un usuario con este email."
-            )
-        return value
-    
-    def validate_username(self, value):
-        """Valida que el username sea único."""
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError(
-                "Ya existe un usuario con este nombre de usuario."
-            )
-        return value
+    first_name = serializers.CharField(
+        max_length=150,
+        required=False,
+        allow_blank=True,
+        help_text='Nombre del usuario'
+    )
+    last_name = serializers.CharField(
+        max_length=150,
+        required=False,
+        allow_blank=True,
+        help_text='Apellido del usuario'
+    )
+    password = PasswordField(
+        min_length=8,
+        help_text="La contraseña debe tener al menos 8 caracteres"
+    )
+    password_confirm = PasswordField(
+        help_text="Confirma tu contraseña"
+    )
     
     def validate(self, attrs):
-        """Valida que las contraseñas coincidan y sean seguras."""
-        password = attrs.get('password')
-        password_confirm = attrs.get('password_confirm')
+        """Valida que las contraseñas coincidan y sean seguras.
+        
+        La unicidad de email y username la garantizan los índices únicos
+        de auth_user al insertar el usuario (ver create()).
+        """
+        password = attrs['password']
+        
+        # Normalizar el email para almacenarlo siempre en minúsculas
+        attrs['email'] = attrs['email'].lower()
         
-        # Verificar que las contraseñas coincidan
-        if password != password_confirm:
+        # Verificar que las contraseñas coincidan antes de encolar el KDF,
+        # así una solicitud rechazada no ocupa un worker del pool
+        if not passwords_match(password, attrs['password_confirm']):
             raise serializers.ValidationError({
                 'password_confirm': 'Las contraseñas no coinciden.'
             })
         
-        # Validar la fortaleza de la contraseña usando los validadores de Django
+        # Iniciar el hasheo de la contraseña en segundo plano para que se
+        # solape con los validadores
+        self._password_hash = _PASSWORD_HASHER_POOL.submit(
+            make_password, password
+        )
+        
         try:
-            validate_password(password)
-        except ValidationError as e:
-            raise serializers.ValidationError({
-                'password': list(e.messages)
-            })
+            # Validar la fortaleza de la contraseña en el hilo de la request
+            # mientras el hash avanza en el pool
+            validate_password_strength(password, 'password')
+        except BaseException:
+            # Descartar el hash si todavía no empezó a calcularse
+            self._password_hash.cancel()
+            raise
         
         return attrs
     
+    def _get_uniqueness_errors(self, email, username):
+        """Retorna los errores de unicidad para email y username.
+        
+        Solo se consulta cuando el INSERT falla por un conflicto, para
+        indicar qué campo ya está en uso.
+        """
+        errors = {}
+        existing = User.objects.alias(
+            email_lower=Lower('email')
+        ).filter(
+            (Q(email_lower=email) & ~Q(email='')) | Q(username=username)
+        ).values_list('email', 'username')
+        
+        for existing_email, existing_username in existing:
+            if existing_email.lower() == email:
+                errors['email'] = ['Ya existe un usuario con este email.']
+            if existing_username == username:
+                errors['username'] = ['Ya existe un usuario con este nombre de usuario.']
+        
+        return errors
+    
     def create(self, validated_data):
         """Crea un nuevo usuario con la contraseña hasheada."""
         # Remover password_confirm ya que no es parte del modelo
         validated_data.pop('password_confirm')
         
-        # Crear el usuario
-        user = User.objects.create_user(
-            username=validated_data['username'],
+        # Crear el usuario con el hash calculado durante la validación
+        user = User(
+            username=User.normalize_username(validated_data['username']),
             email=validated_data['email'],
-            password=validated_data['password'],
             first_name=validated_data.get('first_name', ''),
             last_name=validated_data.get('last_name', '')
         )
+        user.password = self._password_hash.result()
+        
+        # Insertar directamente y dejar que los índices únicos detecten
+        # duplicados, sin consultas previas ni condiciones de carrera
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            errors = self._get_uniqueness_errors(user.email, user.username)
+            if not errors:
+                raise
+            raise serializers.ValidationError(errors)
         
         return user
 
@@ -112,12 +309,18 @@ class UserLoginSerializer(serializers.Serializer):
     necesaria para la autenticación.
     """
     
+    # Columnas necesarias para verificar la contraseña y armar la respuesta
+    # del login; el resto de la fila de auth_user no se carga
+    USER_FIELDS = (
+        'id', 'username', 'email', 'first_name', 'last_name',
+        'password', 'is_active',
+    )
+    
     username = serializers.CharField(
         help_text="Nombre de usuario o email"
     )
-    password = serializers.CharField(
-        write_only=True,
-        style={'input_type': 'password'},
+    password = PasswordField(
+        normalize=False,
         help_text="Contraseña del usuario"
     )
     
@@ -127,28 +330,40 @@ class UserLoginSerializer(serializers.Serializer):
         password = attrs.get('password')
         
         if username and password:
-            # Intentar autenticar con username
-            user = authenticate(username=username, password=password)
+            # Buscar al usuario por username o email en una sola consulta
+            candidates = list(
+                User.objects.only(*self.USER_FIELDS).alias(
+                    email_lower=Lower('email')
+                ).filter(
+                    Q(username=username)
+                    | (Q(email_lower=username.lower()) & ~Q(email=''))
+                )[:2]
+            )
             
-            # Si no funciona con username, intentar con email
-            if not user:
-                try:
-                    user_obj = User.objects.get(email=username)
-                    user = authenticate(username=user_obj.username, password=password)
-                except User.DoesNotExist:
-                    pass
+            # Priorizar la coincidencia exacta por username
+            user = next(
+                (candidate for candidate in candidates if candidate.username == username),
+                candidates[0] if candidates else None
+            )
             
-            if user:
+            if user is None:
+                # Ejecutar el hasher igualmente para no revelar por tiempo
+                # de respuesta si el usuario existe
+                User().set_password(password)
+            elif any(
+                check_password_cached(user, candidate)
+                for candidate in password_candidates(password)
+            ):
                 if not user.is_active:
                     raise serializers.ValidationError(
                         'La cuenta de usuario está desactivada.'
                     )
                 attrs['user'] = user
                 return attrs
-            else:
-                raise serializers.ValidationError(
-                    'Credenciales inválidas. Verifica tu usuario/email y contraseña.'
-                )
+            
+            raise serializers.ValidationError(
+                'Credenciales inválidas. Verifica tu usuario/email y contraseña.'
+            )
         else:
             raise serializers.ValidationError(
                 'Debe proporcionar username/email y contraseña.'
@@ -207,27 +422,25 @@ class ChangePasswordSerializer(serializers.Serializer):
     y la nueva contraseña con confirmación.
     """
     
-    current_password = serializers.CharField(
-        write_only=True,
-        style={'input_type': 'password'},
+    current_password = PasswordField(
+        normalize=False,
         help_text="Contraseña actual del usuario"
     )
-    new_password = serializers.CharField(
-        write_only=True,
+    new_password = PasswordField(
         min_length=8,
-        style={'input_type': 'password'},
         help_text="Nueva contraseña (mínimo 8 caracteres)"
     )
-    new_password_confirm = serializers.CharField(
-        write_only=True,
-        style={'input_type': 'password'},
+    new_password_confirm = PasswordField(
         help_text="Confirma la nueva contraseña"
     )
     
     def validate_current_password(self, value):
         """Valida que la contraseña actual sea correcta."""
         user = self.context['request'].user
-        if not user.check_password(value):
+        if not any(
+            user.check_password(candidate)
+            for candidate in password_candidates(value)
+        ):
             raise serializers.ValidationError(
                 "La contraseña actual es incorrecta."
             )
@@ -235,37 +448,55 @@ class ChangePasswordSerializer(serializers.Serializer):
     
     def validate(self, attrs):
         """Valida que las nuevas contraseñas coincidan y sean seguras."""
-        new_password = attrs.get('new_password')
-        new_password_confirm = attrs.get('new_password_confirm')
-        current_password = attrs.get('current_password')
+        new_password = attrs['new_password']
         
         # Verificar que las nuevas contraseñas coincidan
-        if new_password != new_password_confirm:
+        if not passwords_match(new_password, attrs['new_password_confirm']):
             raise serializers.ValidationError({
                 'new_password_confirm': 'Las nuevas contraseñas no coinciden.'
             })
         
         # Verificar que la nueva contraseña sea diferente a la actual
-        if current_password == new_password:
+        if passwords_match(
+            normalize_password(attrs['current_password']), new_password
+        ):
             raise serializers.ValidationError({
                 'new_password': 'La nueva contraseña debe ser diferente a la actual.'
             })
         
-        # Validar la fortaleza de la nueva contraseña
+        # Hashear la nueva contraseña en segundo plano para que se solape
+        # con los validadores de fortaleza
+        self._new_password_hash = _PASSWORD_HASHER_POOL.submit(
+            make_password, new_password
+        )
+        
         try:
-            validate_password(new_password, user=self.context['request'].user)
-        except ValidationError as e:
-            raise serializers.ValidationError({
-                'new_password': list(e.messages)
-            })
+            # Validar la fortaleza de la nueva contraseña mientras el hash
+            # avanza en el pool
+            validate_password_strength(
+                new_password,
+                'new_password',
+                user=self.context['request'].user
+            )
+        except BaseException:
+            # Descartar el hash si todavía no empezó a calcularse
+            self._new_password_hash.cancel()
+            raise
         
         return attrs
     
     def save(self):
         """Actualiza la contraseña del usuario."""
         user = self.context['request'].user
-        user.set_password(self.validated_data['new_password'])
-        user.save()
+        new_password = self.validated_data['new_password']
+        
+        # UPDATE directo de la columna password con el hash ya calculado,
+        # sin pasar por save() ni disparar pre_save/post_save
+        user.password = self._new_password_hash.result()
+        User.objects.filter(pk=user.pk).update(password=user.password)
+        
+        # Notificar a los validadores igual que lo haría set_password()
+        password_changed(new_password, user)
         return user
 
 
@@ -282,12 +513,16 @@ class RefreshTokenSerializer(serializers.Serializer):
     )
 
     def validate_refresh(self, value):
-        """Valida que el refresh token sea válido y no haya expirado."""
+        """
+        Valida que el refresh token sea válido y no haya expirado.
+        
+        Devuelve el RefreshToken ya decodificado, para que la vista lo
+        use sin volver a verificar la firma.
+        """
         try:
-            # Intentar crear un objeto RefreshToken desde el string
+            # Crear un objeto RefreshToken desde el string
             # Esto validará automáticamente la firma y expiración
-            RefreshToken(value)
-            return value
+            return RefreshToken(value)
         except TokenError:
             raise serializers.ValidationError(
                 "El refresh token no es válido o ha expirado"
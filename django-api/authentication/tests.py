@@ -1,3 +1,69 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
 from django.test import TestCase
 
-# Create your tests here.
+from . import serializers
+from .serializers import UserLoginSerializer, check_password_cached
+
+PASSWORD = 'Sup3rS3cret!x'
+
+
+class CheckPasswordCachedTests(TestCase):
+    """Caché de verificaciones de contraseña del login (check_password_cached)."""
+
+    def setUp(self):
+        serializers._verified_passwords.clear()
+        self.user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+
+    def count_kdf_calls(self):
+        """Espía User.check_password, que ejecuta el KDF."""
+        return mock.patch.object(
+            User, 'check_password', autospec=True, side_effect=User.check_password
+        )
+
+    def test_repeated_success_skips_kdf(self):
+        with self.count_kdf_calls() as check_password:
+            self.assertTrue(check_password_cached(self.user, PASSWORD))
+            self.assertTrue(check_password_cached(self.user, PASSWORD))
+
+        self.assertEqual(check_password.call_count, 1)
+
+    def test_wrong_password_is_never_cached(self):
+        with self.count_kdf_calls() as check_password:
+            self.assertFalse(check_password_cached(self.user, 'incorrecta'))
+            self.assertFalse(check_password_cached(self.user, 'incorrecta'))
+
+        self.assertEqual(check_password.call_count, 2)
+        self.assertEqual(len(serializers._verified_passwords), 0)
+
+    def test_wrong_password_misses_cached_success(self):
+        self.assertTrue(check_password_cached(self.user, PASSWORD))
+
+        self.assertFalse(check_password_cached(self.user, 'incorrecta'))
+
+    def test_password_change_misses_cache(self):
+        self.assertTrue(check_password_cached(self.user, PASSWORD))
+
+        self.user.set_password('Otr4Contr4sena!')
+        self.user.save()
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.count_kdf_calls() as check_password:
+            self.assertFalse(check_password_cached(user, PASSWORD))
+            self.assertTrue(check_password_cached(user, 'Otr4Contr4sena!'))
+
+        self.assertEqual(check_password.call_count, 2)
+
+    def test_inactive_user_is_rejected_after_cached_login(self):
+        data = {'username': 'alice', 'password': PASSWORD}
+        self.assertTrue(UserLoginSerializer(data=data).is_valid())
+
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        serializer = UserLoginSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors['non_field_errors'],
+            ['La cuenta de usuario está desactivada.']
+        )
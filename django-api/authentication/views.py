@@ -1,17 +1,44 @@
+from operator import attrgetter
+
+from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
-from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
 from drf_spectacular.utils import extend_schema, OpenApiResponse
-from rest_framework import serializers
+
+from todoapi.exceptions import validation_error_message
 
 from .serializers import UserRegistrationSerializer, UserLoginSerializer, RefreshTokenSerializer
 
+
 User = get_user_model()
 
+# Campos públicos del usuario incluidos en las respuestas
+USER_PAYLOAD_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name')
+_get_user_payload_values = attrgetter(*USER_PAYLOAD_FIELDS)
+
+
+def user_payload(user):
+    """Retorna los datos públicos del usuario incluidos en las respuestas."""
+    return dict(zip(USER_PAYLOAD_FIELDS, _get_user_payload_values(user)))
+
+
+def token_pair(user):
+    """Genera el par de tokens JWT (access y refresh) para el usuario.
+    
+    El access token se deriva una sola vez del refresh token y cada
+    token se firma una única vez al convertirlo a string.
+    """
+    refresh = RefreshToken.for_user(user)
+    return {
+        'access': str(refresh.access_token),
+        'refresh': str(refresh),
+    }
+
 
 @extend_schema(
     operation_id='auth_register',
@@ -51,6 +78,7 @@ User = get_user_model()
     },
     tags=['Autenticación']
 )
+@validation_error_message('Datos de registro inválidos')
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def register_user(request):
@@ -78,36 +106,19 @@ def register_user(request):
     # Crear instancia del serializer con los datos recibidos
     serializer = UserRegistrationSerializer(data=request.data)
     
-    # Validar los datos
-    if serializer.is_valid():
-        try:
-            # Crear el usuario (el serializer maneja el hasheo de contraseña)
-            user = serializer.save()
-            
-            # Respuesta exitosa con datos del usuario creado
-            return Response({
-                'message': 'Usuario registrado exitosamente',
-                'user': {
-                    'id': user.id,
-                    'username': user.username,
-                    'email': user.email,
-                    'first_name': user.first_name,
-                    'last_name': user.last_name,
-                }
-            }, status=status.HTTP_201_CREATED)
-            
-        except Exception as e:
-            # Manejar errores inesperados durante la creación
-            return Response({
-                'error': 'Error interno del servidor durante el registro',
-                'details': str(e)
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    # Validar los datos (los errores se responden con el formato
+    # {'error', 'details'} desde el exception handler del proyecto)
+    serializer.is_valid(raise_exception=True)
     
-    # Retornar errores de validación
+    # Crear el usuario (el serializer maneja el hasheo de contraseña
+    # y reporta email/username duplicados al insertar)
+    user = serializer.save()
+    
+    # Respuesta exitosa con datos del usuario creado
     return Response({
-        'error': 'Datos de registro inválidos',
-        'details': serializer.errors
-    }, status=status.HTTP_400_BAD_REQUEST)
+        'message': 'Usuario registrado exitosamente',
+        'user': user_payload(user)
+    }, status=status.HTTP_201_CREATED)
 
 
 @extend_schema(
@@ -155,6 +166,7 @@ def register_user(request):
     },
     tags=['Autenticación']
 )
+@validation_error_message('Credenciales de login inválidas')
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def login_user(request):
@@ -180,43 +192,20 @@ def login_user(request):
     serializer = UserLoginSerializer(data=request.data)
     
     # Validar credenciales
-    if serializer.is_valid():
-        try:
-            # Obtener el usuario validado del serializer
-            user = serializer.validated_data['user']
-            
-            # Generar tokens JWT
-            refresh = RefreshToken.for_user(user)
-            access_token = refresh.access_token
-            
-            # Respuesta exitosa con tokens y datos del usuario
-            return Response({
-                'message': 'Login exitoso',
-                'user': {
-                    'id': user.id,
-                    'username': user.username,
-                    'email': user.email,
-                    'first_name': user.first_name,
-                    'last_name': user.last_name,
-                },
-                'tokens': {
-                    'access': str(access_token),
-                    'refresh': str(refresh),
-                }
-            }, status=status.HTTP_200_OK)
-            
-        except Exception as e:
-            # Manejar errores inesperados durante la autenticación
-            return Response({
-                'error': 'Error interno del servidor durante el login',
-                'details': str(e)
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    serializer.is_valid(raise_exception=True)
+    
+    # Obtener el usuario validado del serializer
+    user = serializer.validated_data['user']
     
-    # Retornar errores de validación
+    # Generar tokens JWT
+    tokens = token_pair(user)
+    
+    # Respuesta exitosa con tokens y datos del usuario
     return Response({
-        'error': 'Credenciales de login inválidas',
-        'details': serializer.errors
-    }, status=status.HTTP_400_BAD_REQUEST)
+        'message': 'Login exitoso',
+        'user': user_payload(user),
+        'tokens': tokens
+    }, status=status.HTTP_200_OK)
 
 
 @extend_schema(
@@ -256,6 +245,7 @@ def login_user(request):
     description="Valida un refresh token y genera un nuevo access token. Si está habilitada la rotación de tokens, también se genera un nuevo refresh token.",
     tags=["Autenticación"]
 )
+@validation_error_message('Datos inválidos')
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def refresh_token(request):
@@ -268,69 +258,60 @@ def refresh_token(request):
     3. Si está habilitada la rotación, genera un nuevo refresh token
     4. Retorna los nuevos tokens
     """
+    # Validar los datos de entrada
+    serializer = RefreshTokenSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    
+    # Obtener el RefreshToken ya decodificado por el serializer
+    refresh = serializer.validated_data['refresh']
+    
     try:
-        # Validar los datos de entrada
-        serializer = RefreshTokenSerializer(data=request.data)
-        if not serializer.is_valid():
-            return Response(
-                {'error': 'Datos inválidos', 'details': serializer.errors},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        # Rechazar tokens de usuarios eliminados o desactivados (una
+        # consulta EXISTS, sin cargar la fila del usuario)
+        user_id = refresh.payload.get(jwt_settings.USER_ID_CLAIM)
+        if not User.objects.filter(
+            **{jwt_settings.USER_ID_FIELD: user_id}, is_active=True
+        ).exists():
+            raise TokenError('El usuario del token no existe o está inactivo')
         
-        # Obtener el refresh token validado
-        refresh_token_str = serializer.validated_data['refresh']
+        # Generar nuevo access token
+        new_access_token = str(refresh.access_token)
         
+        # Preparar respuesta
+        response_data = {
+            'access': new_access_token,
+            'message': 'Access token renovado exitosamente'
+        }
+        
+        # Blacklist el refresh token anterior si está configurado
+        # (antes de rotarlo, mientras conserva su jti original)
         try:
-            # Crear objeto RefreshToken desde el string
-            refresh = RefreshToken(refresh_token_str)
-            
-            # Generar nuevo access token
-            new_access_token = str(refresh.access_token)
-            
-            # Preparar respuesta
-            response_data = {
-                'access': new_access_token,
-                'message': 'Access token renovado exitosamente'
-            }
-            
-            # Si está habilitada la rotación de refresh tokens, incluir el nuevo refresh token
-            # Esto se configura en settings.py con ROTATE_REFRESH_TOKENS = True
-            # La rotación está habilitada por defecto en nuestra configuración
-            try:
-                # Obtener el usuario del refresh token
-                user_id = refresh.get('user_id')
-                User = get_user_model()
-                user = User.objects.get(id=user_id)
-                
-                # Generar nuevo refresh token
-                new_refresh = RefreshToken.for_user(user)
-                response_data['refresh'] = str(new_refresh)
-                
-                # Blacklist el refresh token anterior si está configurado
-                try:
-                    refresh.blacklist()
-                except AttributeError:
-                    # Si no está disponible el blacklist, continuar
-                    pass
-            except (User.DoesNotExist, KeyError):
-                # Si hay problemas obteniendo el usuario, solo devolver el access token
-                pass
-            
-            return Response(response_data, status=status.HTTP_200_OK)
-            
-        except TokenError as e:
-            return Response(
-                {'error': 'Refresh token inválido o expirado'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except InvalidToken as e:
-            return Response(
-                {'error': 'Token inválido'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-            
-    except Exception as e:
+            refresh.blacklist()
+        except AttributeError:
+            # Si no está disponible el blacklist, continuar
+            pass
+        
+        # Si está habilitada la rotación de refresh tokens, incluir el nuevo refresh token
+        # Esto se configura en settings.py con ROTATE_REFRESH_TOKENS = True
+        # La rotación está habilitada por defecto en nuestra configuración
+        # Se rota el mismo token (nuevo jti, exp e iat) en lugar de crear
+        # uno nuevo, así conserva los claims del usuario sin volver a
+        # cargarlo de la base de datos
+        refresh.set_jti()
+        refresh.set_exp()
+        refresh.set_iat()
+        refresh.outstand()
+        response_data['refresh'] = str(refresh)
+        
+        return Response(response_data, status=status.HTTP_200_OK)
+        
+    except TokenError as e:
+        return Response(
+            {'error': 'Refresh token inválido o expirado'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except InvalidToken as e:
         return Response(
-            {'error': 'Error interno del servidor'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            {'error': 'Token inválido'},
+            status=status.HTTP_400_BAD_REQUEST
         )
@@ -17,6 +17,12 @@ ENVIRONMENTS = {
     'prod': 'todoapi.settings.production',  # Alias
 }
 
+# Reverse lookup from settings module to environment name. Iterating in
+# reverse lets the canonical name (listed first) win over its aliases.
+MODULE_TO_ENVIRONMENT = {
+    module: name for name, module in reversed(ENVIRONMENTS.items())
+}
+
 
 def set_environment(env_name):
     """Set the Django settings module environment variable.
@@ -24,13 +30,13 @@ def set_environment(env_name):
     Args:
         env_name (str): Environment name ('development', 'production', 'dev', 'prod')
     """
-    if env_name not in ENVIRONMENTS:
+    settings_module = ENVIRONMENTS.get(env_name)
+    if settings_module is None:
         print(f"❌ Error: Unknown environment '{env_name}'")
         print(f"Available environments: {', '.join(ENVIRONMENTS.keys())}")
         return False
     
-    settings_module = ENVIRONMENTS[env_name]
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    os.environ['DJANGO_SETTINGS_MODULE'] = settings_module
     
     print(f"✅ Environment set to: {env_name}")
     print(f"📋 Django settings module: {settings_module}")
@@ -55,11 +61,7 @@ def show_environment_info():
     
     if current:
         # Find environment name from settings module
-        env_name = None
-        for name, module in ENVIRONMENTS.items():
-            if module == current:
-                env_name = name
-                break
+        env_name = MODULE_TO_ENVIRONMENT.get(current)
         
         if env_name:
             print(f"📍 Current Environment: {env_name}")
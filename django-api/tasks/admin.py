@@ -5,8 +5,14 @@ from .models import Task
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ('title', 'user', 'status', 'created_at', 'updated_at')
-    list_filter = ('user', 'status')
-    search_fields = ('title', 'description')
+    # Filtrar por usuario listaría a todos los usuarios en la barra lateral;
+    # para eso se puede buscar por username
+    list_filter = ('status',)
+    search_fields = ('title', 'description', 'user__username')
     ordering = ('-created_at',)
+    # Traer el usuario en la misma consulta del listado (evita N+1)
+    list_select_related = ('user',)
+    # Selector de usuario con búsqueda (usa search_fields de UserAdmin)
+    autocomplete_fields = ('user',)
 
 # admin.site.register(Task)
@@ -0,0 +1,98 @@
+"""
+Caché de las respuestas del listado de tareas.
+
+Cada usuario tiene un número de versión en la caché que forma parte de
+las claves de sus listados. Cualquier cambio en sus tareas incrementa la
+versión, de modo que las entradas anteriores dejan de usarse y expiran
+solas, sin tener que buscarlas y borrarlas.
+
+Las versiones nuevas parten de time.time_ns(): si la clave de la versión
+se pierde (desalojo, reinicio de la caché) la siguiente no coincide con
+una ya usada, y las páginas viejas siguen siendo inalcanzables.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+
+# Segundos que se conserva una página del listado en la caché
+TASK_LIST_CACHE_TIMEOUT = 60
+
+
+def _version_key(user_id):
+    """Clave de la versión de los listados de un usuario."""
+    return f'tasks:user:{user_id}:version'
+
+
+def get_task_list_version(user_id):
+    """
+    Retorna la versión actual de los listados de tareas del usuario.
+    
+    Args:
+        user_id (int): ID del usuario
+        
+    Returns:
+        int: Versión vigente
+    """
+    return cache.get_or_set(_version_key(user_id), time.time_ns, None)
+
+
+def bump_task_list_version(*user_ids):
+    """
+    Invalida los listados cacheados de los usuarios indicados.
+    
+    Llamar una vez confirmada la transacción que modificó las tareas
+    (transaction.on_commit); si no, una lectura concurrente podría guardar
+    datos anteriores al cambio bajo la versión nueva.
+    
+    Args:
+        *user_ids (int): IDs de los usuarios cuyas tareas cambiaron
+    """
+    for user_id in user_ids:
+        try:
+            cache.incr(_version_key(user_id))
+        except ValueError:
+            # La versión no existe (o expiró): empezar una nueva
+            cache.set(_version_key(user_id), time.time_ns(), None)
+
+
+def task_list_cache_key(request):
+    """
+    Clave de caché para una página del listado de tareas.
+    
+    Incluye la URL completa (página, filtros, búsqueda y orden) y la
+    versión vigente de los listados del usuario.
+    
+    Args:
+        request: La request autenticada del listado
+        
+    Returns:
+        str: Clave de caché
+    """
+    user_id = request.user.pk
+    url_hash = hashlib.md5(
+        request.build_absolute_uri().encode(), usedforsecurity=False
+    ).hexdigest()
+    version = get_task_list_version(user_id)
+    return f'tasks:user:{user_id}:v{version}:list:{url_hash}'
+
+
+def to_cacheable(data):
+    """
+    Convierte los datos de una respuesta en dict/list planos.
+    
+    ReturnDict/ReturnList se serializan con pickle más lento y guardan
+    una referencia al serializer; la caché solo necesita los datos.
+    
+    Args:
+        data: response.data del listado
+        
+    Returns:
+        dict or list: Copia con contenedores planos
+    """
+    if isinstance(data, dict):
+        return {key: to_cacheable(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [to_cacheable(item) for item in data]
+    return data
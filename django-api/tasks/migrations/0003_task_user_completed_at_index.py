@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-15 04:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_user_created_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'completed_at'], name='tasks_user_id_097a24_idx'),
+        ),
+    ]
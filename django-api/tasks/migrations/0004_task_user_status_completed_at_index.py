@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-15 04:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_task_user_completed_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'status', 'completed_at'], name='tasks_user_id_09ffc6_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_user_id_a53e17_idx',
+        ),
+    ]
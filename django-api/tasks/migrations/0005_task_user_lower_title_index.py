@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-15 04:47
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_user_status_completed_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(models.F('user'), django.db.models.functions.text.Lower('title'), name='tasks_user_lower_title_idx'),
+        ),
+    ]
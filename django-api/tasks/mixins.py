@@ -1,6 +1,93 @@
+import copy
+from functools import cache
+
 from rest_framework import serializers
+from django.core.exceptions import FieldDoesNotExist
+from django.db import IntegrityError
 from django.utils import timezone
-from .utils import TaskValidationUtils
+from .models import Task
+from .utils import (
+    get_user_from_context,
+    validate_description_basic,
+    validate_status_basic,
+    validate_status_for_creation,
+    validate_status_transition,
+    validate_title_complete,
+    validate_title_for_update,
+)
+
+
+# Mensaje para los errores de integridad al guardar una tarea
+UPDATE_ERROR_MESSAGE = "Error al actualizar la tarea: {}"
+
+
+class CachedFieldsMixin:
+    """
+    Mixin que construye los campos de un serializer una sola vez por clase.
+    
+    ModelSerializer.get_fields() copia en profundidad los campos declarados
+    e introspecciona el modelo en cada instanciación. Este mixin guarda el
+    resultado de la primera llamada por clase y luego entrega copias
+    profundas, que DRF enlaza (bind) a cada instancia como siempre: se
+    ahorra la introspección del modelo, no la copia.
+    
+    Una copia superficial compartiría con el caché el `child` de los
+    campos de lista, los serializers anidados y error_messages, y al
+    enlazarlos se modificarían los del caché. Como en DRF, la lista
+    `validators` sí se comparte entre copias.
+    
+    Solo debe usarse en serializers cuyos campos no dependan de la
+    instancia ni del contexto.
+    """
+    
+    _fields_cache = {}
+    
+    def get_fields(self):
+        """
+        Retorna copias profundas de los campos cacheados para la clase del serializer.
+        
+        Returns:
+            dict: Nombre de campo -> instancia de campo sin enlazar
+        """
+        cls = type(self)
+        fields = CachedFieldsMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            CachedFieldsMixin._fields_cache[cls] = fields
+        return copy.deepcopy(fields)
+
+
+class DynamicFieldsMixin:
+    """
+    Mixin que permite elegir qué campos incluye un serializer.
+    
+    Acepta el argumento `fields` (lista de nombres) al instanciar el
+    serializer y descarta los demás campos, de modo que no se leen ni se
+    serializan. Los nombres desconocidos se ignoran; si ninguno es válido
+    se mantienen todos los campos.
+    
+    Debe ir antes de CachedFieldsMixin en la herencia para filtrar las
+    copias de los campos cacheados.
+    """
+    
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._requested_fields = frozenset(fields) if fields else None
+    
+    def get_fields(self):
+        """
+        Retorna solo los campos solicitados (o todos si no se pidió ninguno).
+        
+        Returns:
+            dict: Nombre de campo -> instancia de campo sin enlazar
+        """
+        fields = super().get_fields()
+        requested = self._requested_fields
+        if requested:
+            selected = {name: field for name, field in fields.items() if name in requested}
+            if selected:
+                return selected
+        return fields
 
 
 class TaskUpdateMixin:
@@ -16,26 +103,31 @@ class TaskUpdateMixin:
     - Manejo de errores durante la actualización
     """
     
-    def handle_status_transition(self, instance, validated_data):
+    def handle_status_transition(self, instance, validated_data, now=None):
         """
         Maneja la lógica de transición de estados y completed_at.
         
         Args:
             instance: La instancia de la tarea
             validated_data: Los datos validados
+            now: Momento de la actualización (por defecto timezone.now())
             
         Returns:
             dict: Los datos validados actualizados con completed_at si es necesario
         """
+        # Sin cambio de status no hay transición que manejar
+        if 'status' not in validated_data:
+            return validated_data
+        
         old_status = instance.status
-        new_status = validated_data.get('status', old_status)
+        new_status = validated_data['status']
         
         # Si se está marcando como completada, establecer completed_at
-        if old_status != 'completada' and new_status == 'completada':
-            validated_data['completed_at'] = timezone.now()
+        if old_status != Task.STATUS_COMPLETED and new_status == Task.STATUS_COMPLETED:
+            validated_data['completed_at'] = now or timezone.now()
         
         # Si se está cambiando de completada a otro estado, limpiar completed_at
-        elif old_status == 'completada' and new_status != 'completada':
+        elif old_status == Task.STATUS_COMPLETED and new_status != Task.STATUS_COMPLETED:
             validated_data['completed_at'] = None
             
         return validated_data
@@ -52,28 +144,32 @@ class TaskUpdateMixin:
             instance: La instancia actualizada
             
         Raises:
-            serializers.ValidationError: Si ocurre un error durante la actualización
+            serializers.ValidationError: Si el guardado viola una restricción
+                de integridad de la base de datos
         """
+        # Un único timestamp para completed_at y updated_at
+        now = timezone.now()
+        
+        # Manejar transiciones de estado
+        validated_data = self.handle_status_transition(
+            instance, validated_data, now=now
+        )
+        
+        # Actualizar los campos
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        
+        # Actualizar timestamp explícitamente
+        instance.updated_at = now
+        
+        # Guardar solo las columnas modificadas. Solo los errores de
+        # integridad se traducen; el resto se propaga tal cual
         try:
-            # Manejar transiciones de estado
-            validated_data = self.handle_status_transition(instance, validated_data)
-            
-            # Actualizar los campos
-            for attr, value in validated_data.items():
-                setattr(instance, attr, value)
-            
-            # Actualizar timestamp explícitamente
-            instance.updated_at = timezone.now()
-            
-            # Guardar la instancia
-            instance.save()
-            
-            return instance
-            
-        except Exception as e:
-            raise serializers.ValidationError(
-                f"Error al actualizar la tarea: {str(e)}"
-            )
+            instance.save(update_fields=[*validated_data, 'updated_at'])
+        except IntegrityError as e:
+            raise serializers.ValidationError(UPDATE_ERROR_MESSAGE.format(e))
+        
+        return instance
     
     def update(self, instance, validated_data):
         """
@@ -89,6 +185,96 @@ class TaskUpdateMixin:
         return self.perform_update(instance, validated_data)
 
 
+@cache
+def get_select_related_paths(serializer_class):
+    """
+    Relaciones que un serializer recorre y que se pueden unir con un JOIN.
+    
+    Inspecciona los campos del serializer (una vez por clase) y recoge las
+    relaciones ForeignKey/OneToOne que usan: campos relacionados como
+    SlugRelatedField sobre 'user' y campos con source punteado como
+    'user.username'.
+    
+    Args:
+        serializer_class: Clase de un ModelSerializer
+        
+    Returns:
+        tuple: Rutas para select_related (p. ej. ('user',))
+    """
+    model = getattr(getattr(serializer_class, 'Meta', None), 'model', None)
+    if model is None:
+        return ()
+    
+    paths = []
+    for field in serializer_class().fields.values():
+        if isinstance(field, serializers.RelatedField):
+            attrs = field.source.split('.')
+        elif '.' in (field.source or ''):
+            attrs = field.source.split('.')[:-1]
+        else:
+            continue
+        
+        # Seguir solo relaciones hacia un único objeto
+        current, path = model, []
+        for attr in attrs:
+            try:
+                model_field = current._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break
+            if not (model_field.many_to_one or model_field.one_to_one):
+                break
+            path.append(attr)
+            current = model_field.related_model
+        
+        if path:
+            paths.append('__'.join(path))
+    
+    return tuple(dict.fromkeys(paths))
+
+
+class EagerLoadingMixin:
+    """
+    Mixin de ViewSet que evita consultas N+1 según el serializer en uso.
+    
+    Si el serializer define setup_eager_loading(queryset) se usa ese hook;
+    si no, se aplica select_related a las relaciones que recorren sus
+    campos (ver get_select_related_paths).
+    """
+    
+    def setup_eager_loading(self, queryset, serializer_class=None):
+        """
+        Aplica la carga anticipada que necesita el serializer.
+        
+        Args:
+            queryset (QuerySet): Queryset base de la vista
+            serializer_class: Serializer a considerar (por defecto el de
+                la acción actual)
+            
+        Returns:
+            QuerySet: El queryset con las relaciones precargadas
+        """
+        serializer_class = serializer_class or self.get_serializer_class()
+        
+        hook = getattr(serializer_class, 'setup_eager_loading', None)
+        if hook is not None:
+            return hook(queryset)
+        
+        paths = get_select_related_paths(serializer_class)
+        return queryset.select_related(*paths) if paths else queryset
+
+
+@cache
+def get_task_serializer_class():
+    """
+    Retorna TaskSerializer, importándolo solo la primera vez.
+    
+    La importación se difiere para evitar importaciones circulares con
+    serializers.py; luego la clase queda memorizada.
+    """
+    from .serializers import TaskSerializer
+    return TaskSerializer
+
+
 class TaskRepresentationMixin:
     """
     Mixin que centraliza la lógica de representación de tareas.
@@ -107,10 +293,20 @@ class TaskRepresentationMixin:
         Returns:
             dict: La representación serializada de la tarea
         """
-        # Importar aquí para evitar importaciones circulares
-        from .serializers import TaskSerializer
+        TaskSerializer = get_task_serializer_class()
+        
+        # Si este serializer ya es un TaskSerializer, representar directamente
+        if isinstance(self, TaskSerializer):
+            return super().to_representation(instance)
+        
+        # Reutilizar un único TaskSerializer por instancia de este serializer
+        # (en listados se construye una vez, no una vez por tarea)
+        task_serializer = getattr(self, '_task_serializer', None)
+        if task_serializer is None:
+            task_serializer = TaskSerializer(context=self.context)
+            self._task_serializer = task_serializer
         
-        return TaskSerializer(instance, context=self.context).data
+        return task_serializer.to_representation(instance)
     
     def to_representation(self, instance):
         """
@@ -145,15 +341,15 @@ class TaskValidationMixin:
             str: El valor validado
         """
         if for_update:
-            return TaskValidationUtils.validate_title_for_update(
+            return validate_title_for_update(
                 value, 
-                TaskValidationUtils.get_user_from_context(self.context),
+                get_user_from_context(self.context),
                 self.instance
             )
         else:
-            return TaskValidationUtils.validate_title_complete(
+            return validate_title_complete(
                 value,
-                TaskValidationUtils.get_user_from_context(self.context),
+                get_user_from_context(self.context),
                 None  # Para creación no hay instancia que excluir
             )
     
@@ -168,7 +364,7 @@ class TaskValidationMixin:
         Returns:
             str: El valor validado
         """
-        return TaskValidationUtils.validate_description_basic(value, required=required)
+        return validate_description_basic(value, required=required)
     
     def validate_task_status(self, value, for_creation=False):
         """
@@ -182,9 +378,9 @@ class TaskValidationMixin:
             str: El valor validado
         """
         if for_creation:
-            return TaskValidationUtils.validate_status_for_creation(value)
+            return validate_status_for_creation(value)
         else:
-            return TaskValidationUtils.validate_status_basic(value)
+            return validate_status_basic(value)
     
     def validate_ownership_and_transitions(self, attrs):
         """
@@ -199,26 +395,23 @@ class TaskValidationMixin:
         Raises:
             serializers.ValidationError: Si la validación falla
         """
-        try:
-            # Validar propiedad (solo para updates)
-            if hasattr(self, 'instance') and self.instance:
-                user = TaskValidationUtils.get_user_from_context(self.context)
-                if self.instance.user != user:
-                    raise serializers.ValidationError({
-                        'non_field_errors': 'No tienes permisos para actualizar esta tarea.'
-                    })
-            
-            # Validar transiciones de estado
-            if 'status' in attrs and hasattr(self, 'instance') and self.instance:
-                TaskValidationUtils.validate_status_transition(
+        # Validar propiedad (solo para updates)
+        if hasattr(self, 'instance') and self.instance:
+            user = get_user_from_context(self.context)
+            if self.instance.user_id != user.pk:
+                raise serializers.ValidationError({
+                    'non_field_errors': 'No tienes permisos para actualizar esta tarea.'
+                })
+        
+        # Validar transiciones de estado (sus errores se asocian a 'status')
+        if 'status' in attrs and hasattr(self, 'instance') and self.instance:
+            try:
+                validate_status_transition(
                     self.instance.status,
                     attrs['status'],
                     self.instance
                 )
-            
-            return attrs
-            
-        except serializers.ValidationError as e:
-            raise serializers.ValidationError({
-                'status': str(e)
-            })
\ No newline at end of file
+            except serializers.ValidationError as e:
+                raise serializers.ValidationError({'status': e.detail})
+        
+        return attrs
@@ -1,7 +1,11 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.functions import Lower
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
+from .cache import bump_task_list_version
+
 User = get_user_model()
 
 
@@ -13,13 +17,21 @@ class Task(models.Model):
     que puede cambiar a lo largo de su ciclo de vida.
     """
     
+    # Valores del campo status
+    STATUS_PENDING = 'pendiente'
+    STATUS_IN_PROGRESS = 'en_progreso'
+    STATUS_COMPLETED = 'completada'
+    
     # Choices para el campo status
     STATUS_CHOICES = [
-        ('pendiente', 'Pendiente'),
-        ('en_progreso', 'En Progreso'),
-        ('completada', 'Completada'),
+        (STATUS_PENDING, 'Pendiente'),
+        (STATUS_IN_PROGRESS, 'En Progreso'),
+        (STATUS_COMPLETED, 'Completada'),
     ]
     
+    # Conjunto de estados válidos para validaciones rápidas
+    VALID_STATUSES = frozenset(choice[0] for choice in STATUS_CHOICES)
+    
     # Campos principales
     title = models.CharField(
         max_length=200,
@@ -37,7 +49,7 @@ class Task(models.Model):
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
-        default='pendiente',
+        default=STATUS_PENDING,
         verbose_name="Status",
         help_text="Current status of the task"
     )
@@ -77,9 +89,13 @@ class Task(models.Model):
         verbose_name_plural = "Tasks"
         ordering = ['-created_at']  # Ordenar por fecha de creación descendente
         indexes = [
-            models.Index(fields=['user', 'status']),  # Índice compuesto para optimizar queries
+            models.Index(fields=['user', 'status', 'completed_at']),  # Filtros por estado y estadísticas
+            models.Index(fields=['user', '-created_at']),  # Listado de tareas del usuario ya ordenado
+            models.Index(fields=['user', 'completed_at']),  # Tareas completadas por rango de fechas
             models.Index(fields=['created_at']),      # Índice para ordenamiento
             models.Index(fields=['status']),          # Índice para filtros por estado
+            # Unicidad de títulos sin distinguir mayúsculas (validate_title_uniqueness)
+            models.Index(F('user'), Lower('title'), name='tasks_user_lower_title_idx'),
         ]
     
     def __str__(self):
@@ -89,6 +105,91 @@ class Task(models.Model):
         """
         return f"{self.title} ({self.get_status_display()})"
     
+    @classmethod
+    def completed_at_for(cls, status, now):
+        """
+        Valor de completed_at que corresponde a un estado.
+        
+        Args:
+            status (str): Estado de la tarea
+            now (datetime): Momento del cambio de estado
+            
+        Returns:
+            datetime or None: `now` si el estado es completada, None si no
+        """
+        return now if status == cls.STATUS_COMPLETED else None
+    
+    @classmethod
+    def bulk_change_status(cls, queryset, new_status, now=None, user_ids=None):
+        """
+        Cambia el estado de varias tareas con un único UPDATE.
+        
+        Las tareas que ya tienen `new_status` no se modifican. completed_at
+        se establece al completar y se limpia en cualquier otro estado.
+        Como update() no emite señales, invalida aquí los listados
+        cacheados de los propietarios afectados (al confirmar la
+        transacción).
+        
+        Args:
+            queryset (QuerySet): Tareas a actualizar
+            new_status (str): Nuevo estado para las tareas
+            now (datetime): Momento del cambio (por defecto timezone.now())
+            user_ids (iterable): Propietarios de las tareas, si ya se
+                conocen; si no, se consultan bloqueando las filas
+            
+        Returns:
+            int: Cantidad de tareas cuyo estado cambió
+        """
+        now = now or timezone.now()
+        queryset = queryset.exclude(status=new_status)
+        
+        with transaction.atomic():
+            if user_ids is None:
+                # Bloquear las filas para que el propietario no cambie
+                # entre la consulta y el UPDATE
+                user_ids = set(
+                    queryset.select_for_update().values_list('user_id', flat=True)
+                )
+            updated = queryset.update(
+                status=new_status,
+                completed_at=cls.completed_at_for(new_status, now),
+                updated_at=now,
+            )
+            
+            if updated:
+                transaction.on_commit(
+                    lambda: bump_task_list_version(*user_ids)
+                )
+        
+        return updated
+    
+    def _set_status(self, new_status):
+        """
+        Cambia el estado de esta tarea usando bulk_change_status().
+        
+        Args:
+            new_status (str): Nuevo estado para la tarea
+            
+        Returns:
+            bool: True si el estado cambió, False si ya tenía ese estado
+        """
+        if self.status == new_status:
+            return False
+        
+        now = timezone.now()
+        Task.bulk_change_status(
+            Task.objects.filter(pk=self.pk),
+            new_status,
+            now=now,
+            user_ids=(self.user_id,)
+        )
+        
+        # Reflejar el cambio en la instancia en memoria
+        self.status = new_status
+        self.completed_at = self.completed_at_for(new_status, now)
+        self.updated_at = now
+        return True
+    
     def mark_as_completed(self):
         """
         Marca la tarea como completada y establece la fecha de completado.
@@ -96,12 +197,7 @@ class Task(models.Model):
         Returns:
             bool: True si la tarea fue marcada como completada, False si ya estaba completada
         """
-        if self.status != 'completada':
-            self.status = 'completada'
-            self.completed_at = timezone.now()
-            self.save(update_fields=['status', 'completed_at', 'updated_at'])
-            return True
-        return False
+        return self._set_status(self.STATUS_COMPLETED)
     
     def mark_as_pending(self):
         """
@@ -110,12 +206,7 @@ class Task(models.Model):
         Returns:
             bool: True si el estado cambió, False si ya estaba pendiente
         """
-        if self.status != 'pendiente':
-            self.status = 'pendiente'
-            self.completed_at = None
-            self.save(update_fields=['status', 'completed_at', 'updated_at'])
-            return True
-        return False
+        return self._set_status(self.STATUS_PENDING)
     
     def mark_as_in_progress(self):
         """
@@ -124,12 +215,7 @@ class Task(models.Model):
         Returns:
             bool: True si el estado cambió, False si ya estaba en progreso
         """
-        if self.status != 'en_progreso':
-            self.status = 'en_progreso'
-            self.completed_at = None
-            self.save(update_fields=['status', 'completed_at', 'updated_at'])
-            return True
-        return False
+        return self._set_status(self.STATUS_IN_PROGRESS)
     
     def change_status(self, new_status):
         """
@@ -144,25 +230,11 @@ class Task(models.Model):
         Raises:
             ValueError: Si el nuevo estado no es válido
         """
-        valid_statuses = [choice[0] for choice in self.STATUS_CHOICES]
-        
-        if new_status not in valid_statuses:
+        if new_status not in self.VALID_STATUSES:
+            valid_statuses = [choice[0] for choice in self.STATUS_CHOICES]
             raise ValueError(f"Estado inválido: {new_status}. Estados válidos: {valid_statuses}")
         
-        if self.status != new_status:
-            old_status = self.status
-            self.status = new_status
-            
-            # Manejar completed_at según el nuevo estado
-            if new_status == 'completada':
-                self.completed_at = timezone.now()
-            else:
-                self.completed_at = None
-            
-            self.save(update_fields=['status', 'completed_at', 'updated_at'])
-            return True
-        
-        return False
+        return self._set_status(new_status)
     
     @property
     def is_completed(self):
@@ -172,7 +244,7 @@ class Task(models.Model):
         Returns:
             bool: True si la tarea está completada, False en caso contrario
         """
-        return self.status == 'completada'
+        return self.status == self.STATUS_COMPLETED
     
     @property
     def is_overdue(self):
@@ -186,14 +258,18 @@ class Task(models.Model):
         # TODO: Implementar cuando se agregue campo due_date
         return False
     
-    def get_duration_since_creation(self):
+    def get_duration_since_creation(self, now=None):
         """
         Calcula el tiempo transcurrido desde la creación de la tarea.
         
+        Args:
+            now (datetime): Momento de referencia; al procesar varias
+                tareas se puede calcular una vez y reutilizar
+            
         Returns:
             timedelta: Tiempo transcurrido desde la creación
         """
-        return timezone.now() - self.created_at
+        return (now or timezone.now()) - self.created_at
     
     def get_completion_time(self):
         """
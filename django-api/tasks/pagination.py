@@ -0,0 +1,24 @@
+"""
+Paginación de los listados de tareas.
+
+La paginación por número de página ejecuta un COUNT(*) y un OFFSET en
+cada página, cuyo costo crece con el número de tareas. La paginación por
+cursor avanza con un rango sobre la columna de ordenamiento (cubierta por
+el índice (user, -created_at)) y no cuenta filas.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Paginación por cursor ordenada por fecha de creación descendente.
+    
+    La respuesta tiene la forma {next, previous, results}: no incluye
+    'count' y las páginas se recorren con los enlaces next/previous.
+    """
+    
+    ordering = ('-created_at', '-id')  # id desempata tareas creadas a la vez
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
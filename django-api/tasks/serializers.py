@@ -1,12 +1,175 @@
+from functools import partial
+
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from django.contrib.auth import get_user_model
+from django.db import models
+from django.db.models import prefetch_related_objects
 from django.utils import timezone
+from .mixins import CachedFieldsMixin, DynamicFieldsMixin
 from .models import Task
 
 User = get_user_model()
 
+# Texto legible de cada estado (equivale a get_status_display())
+STATUS_DISPLAY = dict(Task.STATUS_CHOICES)
+
 
-class TaskSerializer(serializers.ModelSerializer):
+def clean_task_title(value, empty_message="El título no puede estar vacío."):
+    """
+    Valida y normaliza el título de una tarea.
+    
+    Se asigna como `validate_title` en los serializers de tareas; al ser
+    una función de módulo, DRF la llama sin enlazarla a cada instancia.
+    
+    Args:
+        value (str): El título a validar
+        empty_message (str): Mensaje de error para un título vacío
+        
+    Returns:
+        str: El título sin espacios al inicio ni al final
+        
+    Raises:
+        serializers.ValidationError: Si el título no es válido
+    """
+    if value is None:
+        return value
+    
+    # Un solo strip() para todas las comprobaciones
+    stripped = value.strip()
+    length = len(stripped)
+    
+    if not length:
+        raise serializers.ValidationError(empty_message)
+    
+    if length < 3:
+        raise serializers.ValidationError("El título debe tener al menos 3 caracteres.")
+    
+    if len(value) > 200:
+        raise serializers.ValidationError("El título no puede exceder 200 caracteres.")
+    
+    return stripped
+
+
+def get_context_user(context):
+    """
+    Retorna el usuario autenticado de la request del contexto.
+    
+    Resuelve request.user (un objeto perezoso) una sola vez.
+    
+    Args:
+        context (dict): El contexto del serializer
+        
+    Returns:
+        User: El usuario autenticado
+        
+    Raises:
+        serializers.ValidationError: Si no hay un usuario autenticado
+    """
+    user = getattr(context.get('request'), 'user', None)
+    if user is None or not user.is_authenticated:
+        raise serializers.ValidationError("Usuario no disponible en el contexto.")
+    return user
+
+
+def attach_request_user(tasks, context):
+    """
+    Asigna el usuario de la request como `user` de las tareas que le pertenecen.
+    
+    Las vistas solo retornan tareas del usuario autenticado, que ya está en
+    memoria en request.user; así task.user no necesita JOIN ni query extra.
+    
+    Args:
+        tasks (iterable): Instancias de Task
+        context (dict): El contexto del serializer (o de la vista)
+    """
+    user = getattr(context.get('request'), 'user', None)
+    if user is None or not user.is_authenticated:
+        return
+    
+    set_cached_user = Task.user.field.set_cached_value
+    for task in tasks:
+        if task.user_id == user.pk:
+            set_cached_user(task, user)
+
+
+def apply_task_update(instance, validated_data):
+    """
+    Aplica los datos validados a una tarea y la guarda.
+    
+    Lógica compartida por TaskSerializer.update y TaskUpdateSerializer.update:
+    asigna los campos, ajusta completed_at según la transición de estado y
+    escribe solo las columnas modificadas.
+    
+    Args:
+        instance (Task): La instancia de tarea a actualizar
+        validated_data (dict): Los datos validados
+        
+    Returns:
+        Task: La instancia actualizada
+    """
+    # Obtener el estado anterior y nuevo
+    old_status = instance.status
+    new_status = validated_data.get('status', old_status)
+    
+    # Actualizar los campos
+    for attr, value in validated_data.items():
+        setattr(instance, attr, value)
+    
+    # Columnas a escribir (updated_at es auto_now y debe incluirse)
+    update_fields = [*validated_data, 'updated_at']
+    
+    # Lógica de negocio para completed_at: solo cambia cuando la tarea
+    # entra o sale del estado completada (ahora al completar, None al salir)
+    was_completed = old_status == Task.STATUS_COMPLETED
+    is_completed = new_status == Task.STATUS_COMPLETED
+    if was_completed != is_completed:
+        instance.completed_at = Task.completed_at_for(new_status, timezone.now())
+        update_fields.append('completed_at')
+    
+    # UPDATE solo de las columnas modificadas
+    instance.save(update_fields=update_fields)
+    return instance
+
+
+class StatusDisplayField(serializers.CharField):
+    """
+    Campo de solo lectura con el texto legible del estado de una tarea.
+    
+    Lee `status` y lo traduce con STATUS_DISPLAY, sin llamar a
+    get_status_display() en cada fila.
+    """
+    
+    def __init__(self, **kwargs):
+        kwargs.setdefault('source', 'status')
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def to_representation(self, value):
+        """Retorna el texto del estado (o el valor crudo si no se conoce)."""
+        return STATUS_DISPLAY.get(value, value)
+
+
+class IsCompletedField(serializers.BooleanField):
+    """
+    Campo de solo lectura que indica si una tarea está completada.
+    
+    Se calcula a partir de `status`, que ya se leyó para el resto de
+    campos, en lugar de acceder a la propiedad Task.is_completed.
+    """
+    
+    def __init__(self, **kwargs):
+        kwargs.setdefault('source', 'status')
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def to_representation(self, value):
+        """Retorna True si el estado es completada."""
+        return value == Task.STATUS_COMPLETED
+
+
+class TaskSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer principal para el modelo Task.
     
@@ -18,17 +181,22 @@ class TaskSerializer(serializers.ModelSerializer):
     """
     
     # Campo de solo lectura para mostrar información del usuario
-    user = serializers.StringRelatedField(read_only=True)
+    # (lee user.username directamente, sin pasar por User.__str__)
+    user = serializers.SlugRelatedField(
+        slug_field='username',
+        read_only=True,
+        help_text='Nombre de usuario del propietario de la tarea'
+    )
     
     # Campo de solo lectura para mostrar el estado en formato legible
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    status_display = StatusDisplayField()
     
-    # Campos calculados de solo lectura
-    is_completed = serializers.SerializerMethodField()
+    # Campo calculado de solo lectura (a partir de status)
+    is_completed = IsCompletedField()
     
     class Meta:
         model = Task
-        fields = [
+        fields = (
             'id',
             'title',
             'description',
@@ -39,8 +207,8 @@ class TaskSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
             'completed_at',
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id',
             'user',
             'status_display',
@@ -48,98 +216,95 @@ class TaskSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
             'completed_at',
-        ]
+        )
     
-    def get_is_completed(self, obj):
-        """
-        Determina si la tarea está completada.
-        
-        Args:
-            obj (Task): La instancia de tarea
-            
-        Returns:
-            bool: True si la tarea está completada
-        """
-        return obj.status == 'completada'
+    # Validador de campo compartido (función de módulo, sin enlazar por instancia)
+    validate_title = staticmethod(clean_task_title)
     
-    def validate_title(self, value):
+    @staticmethod
+    def setup_eager_loading(queryset):
         """
-        Valida el título de la tarea.
+        Carga anticipada para este serializer: ninguna.
+        
+        El único campo relacionado es `user`, que en las vistas de tareas es
+        siempre request.user (ver attach_request_user); unir la tabla de
+        usuarios solo agregaría columnas a la fila.
         
         Args:
-            value (str): El título a validar
+            queryset (QuerySet): Queryset de tareas
             
         Returns:
-            str: El título validado
-            
-        Raises:
-            serializers.ValidationError: Si el título no es válido
+            QuerySet: El mismo queryset
         """
-        if not value or not value.strip():
-            raise serializers.ValidationError("El título no puede estar vacío.")
-        
-        if len(value.strip()) < 3:
-            raise serializers.ValidationError("El título debe tener al menos 3 caracteres.")
-        
-        if len(value) > 200:
-            raise serializers.ValidationError("El título no puede exceder 200 caracteres.")
-        
-        return value.strip()
+        return queryset
     
-    def validate_status(self, value):
+    def update(self, instance, validated_data):
         """
-        Valida el estado de la tarea.
+        Actualiza una tarea existente con lógica de negocio para completed_at.
         
         Args:
-            value (str): El estado a validar
+            instance (Task): La instancia de tarea a actualizar
+            validated_data (dict): Los datos validados
             
         Returns:
-            str: El estado validado
-            
-        Raises:
-            serializers.ValidationError: Si el estado no es válido
+            Task: La instancia actualizada
         """
-        valid_statuses = [choice[0] for choice in Task.STATUS_CHOICES]
-        
-        if value not in valid_statuses:
-            raise serializers.ValidationError(
-                f"Estado inválido. Estados válidos: {', '.join(valid_statuses)}"
-            )
-        
-        return value
+        return apply_task_update(instance, validated_data)
+
+
+class TaskFastListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer para listados de tareas con un camino rápido por fila.
     
-    def update(self, instance, validated_data):
+    - Evalúa el queryset una sola vez, toma el propietario de request.user
+      y carga en bloque los usuarios que falten
+    - Resuelve los campos legibles del hijo una sola vez, fuera del bucle
+    - Por cada tarea aplica directamente get_attribute/to_representation
+      de cada campo, igual que Serializer.to_representation
+    """
+    
+    def to_representation(self, data):
         """
-        Actualiza una tarea existente con lógica de negocio para completed_at.
+        Lista de tareas -> lista de diccionarios de tipos primitivos.
         
         Args:
-            instance (Task): La instancia de tarea a actualizar
-            validated_data (dict): Los datos validados
+            data: QuerySet, Manager o iterable de tareas
             
         Returns:
-            Task: La instancia actualizada
+            list: Representación de cada tarea
         """
-        # Obtener el estado anterior y nuevo
-        old_status = instance.status
-        new_status = validated_data.get('status', old_status)
+        # Un hijo con to_representation propio usa el camino estándar
+        if type(self.child).to_representation is not serializers.Serializer.to_representation:
+            return super().to_representation(data)
         
-        # Actualizar los campos
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        tasks = list(iterable)
         
-        # Lógica de negocio para completed_at
-        if old_status != 'completada' and new_status == 'completada':
-            # Marcar como completada por primera vez
-            instance.completed_at = timezone.now()
-        elif old_status == 'completada' and new_status != 'completada':
-            # Desmarcar como completada
-            instance.completed_at = None
+        attach_request_user(tasks, self.context)
+        prefetch_related_objects(tasks, 'user')
         
-        instance.save()
-        return instance
+        fields = [
+            (field.field_name, field.get_attribute, field.to_representation)
+            for field in self.child._readable_fields
+        ]
+        
+        results = []
+        for task in tasks:
+            ret = {}
+            for field_name, get_attribute, to_representation in fields:
+                try:
+                    attribute = get_attribute(task)
+                except SkipField:
+                    continue
+                
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                ret[field_name] = None if check_for_none is None else to_representation(attribute)
+            results.append(ret)
+        
+        return results
 
 
-class TaskListSerializer(serializers.ModelSerializer):
+class TaskListSerializer(DynamicFieldsMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer optimizado para listados de tareas.
     
@@ -151,17 +316,18 @@ class TaskListSerializer(serializers.ModelSerializer):
     """
     
     # Campo de solo lectura para mostrar el estado en formato legible
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    status_display = StatusDisplayField()
     
     # Campo calculado para mostrar si la tarea está completada
-    is_completed = serializers.SerializerMethodField()
+    # (a partir de status)
+    is_completed = IsCompletedField()
     
     # Campo para mostrar información básica del usuario
     user_username = serializers.CharField(source='user.username', read_only=True)
     
     class Meta:
         model = Task
-        fields = [
+        fields = (
             'id',
             'title',
             'description',
@@ -171,23 +337,41 @@ class TaskListSerializer(serializers.ModelSerializer):
             'is_completed',
             'created_at',
             'completed_at',
-        ]
+        )
         read_only_fields = fields  # Todos los campos son de solo lectura en listados
+        list_serializer_class = TaskFastListSerializer
+    
+    # Columnas de las instancias Task del listado (user_id en lugar del JOIN)
+    INSTANCE_FIELDS = (
+        'id',
+        'title',
+        'description',
+        'status',
+        'created_at',
+        'completed_at',
+        'user',
+    )
     
-    def get_is_completed(self, obj):
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        Determina si la tarea está completada.
+        Limita el queryset a las columnas que usa este serializer.
+        
+        Carga solo las columnas propias del listado (user_id incluido),
+        evitando traer e hidratar columnas que no se muestran. No une la
+        tabla de usuarios: el propietario se toma de request.user (ver
+        attach_request_user).
         
         Args:
-            obj (Task): La instancia de tarea
+            queryset (QuerySet): Queryset de tareas
             
         Returns:
-            bool: True si la tarea está completada
+            QuerySet: El queryset optimizado para listados
         """
-        return obj.status == 'completada'
+        return queryset.only(*cls.INSTANCE_FIELDS)
 
 
-class TaskCreateSerializer(serializers.ModelSerializer):
+class TaskCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer especializado para crear nuevas tareas.
     
@@ -197,64 +381,37 @@ class TaskCreateSerializer(serializers.ModelSerializer):
     - Asignación automática del usuario
     """
     
+    # Campos declarados: DRF no tiene que inspeccionar el modelo ni
+    # combinar extra_kwargs para construirlos
+    title = serializers.CharField(
+        max_length=200,
+        help_text='Descriptive title of the task (maximum 200 characters)'
+    )
+    description = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        allow_null=True,
+        style={'base_template': 'textarea.html'},
+        help_text='Descripción detallada de la tarea (opcional)'
+    )
+    status = serializers.ChoiceField(
+        choices=Task.STATUS_CHOICES,
+        default=Task.STATUS_PENDING,
+        help_text='Estado inicial de la tarea (por defecto: pendiente)'
+    )
+    
     class Meta:
         model = Task
-        fields = [
+        fields = (
             'title',
             'description',
             'status',
-        ]
-        extra_kwargs = {
-            'status': {
-                'default': 'pendiente',
-                'help_text': 'Estado inicial de la tarea (por defecto: pendiente)'
-            },
-            'description': {
-                'required': False,
-                'allow_blank': True,
-                'help_text': 'Descripción detallada de la tarea (opcional)'
-            }
-        }
-    
-    def validate_title(self, value):
-        """
-        Valida el título para creación.
-        
-        Args:
-            value (str): El título a validar
-            
-        Returns:
-            str: El título validado
-        """
-        if not value or not value.strip():
-            raise serializers.ValidationError("El título es requerido.")
-        
-        if len(value.strip()) < 3:
-            raise serializers.ValidationError("El título debe tener al menos 3 caracteres.")
-        
-        if len(value) > 200:
-            raise serializers.ValidationError("El título no puede exceder 200 caracteres.")
-        
-        return value.strip()
+        )
     
-    def validate_status(self, value):
-        """
-        Valida el estado para creación.
-        
-        Args:
-            value (str): El estado a validar
-            
-        Returns:
-            str: El estado validado
-        """
-        valid_statuses = [choice[0] for choice in Task.STATUS_CHOICES]
-        
-        if value not in valid_statuses:
-            raise serializers.ValidationError(
-                f"Estado inválido. Estados válidos: {', '.join(valid_statuses)}"
-            )
-        
-        return value
+    # Validador de campo compartido (función de módulo, sin enlazar por instancia)
+    validate_title = staticmethod(
+        partial(clean_task_title, empty_message="El título es requerido.")
+    )
     
     def create(self, validated_data):
         """
@@ -267,25 +424,20 @@ class TaskCreateSerializer(serializers.ModelSerializer):
             Task: La nueva instancia de tarea
             
         Raises:
-            serializers.ValidationError: Si no hay usuario en el contexto
+            serializers.ValidationError: Si no hay usuario autenticado en el contexto
         """
-        # Obtener el usuario del contexto de la request
-        request = self.context.get('request')
-        if not request or not request.user:
-            raise serializers.ValidationError("Usuario no disponible en el contexto.")
+        # Asignar el usuario de la request a los datos validados
+        validated_data['user'] = get_context_user(self.context)
         
-        # Asignar el usuario a los datos validados
-        validated_data['user'] = request.user
-        
-        # Si el estado es 'completada', establecer completed_at
-        if validated_data.get('status') == 'completada':
+        # Si el estado es completada, establecer completed_at
+        if validated_data.get('status') == Task.STATUS_COMPLETED:
             validated_data['completed_at'] = timezone.now()
         
         # Crear la tarea
         return Task.objects.create(**validated_data)
 
 
-class TaskUpdateSerializer(serializers.ModelSerializer):
+class TaskUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer especializado para actualizar tareas existentes.
     
@@ -295,72 +447,35 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
     - Lógica de negocio para completed_at
     """
     
+    # Campos declarados (sin extra_kwargs), todos opcionales
+    title = serializers.CharField(
+        max_length=200,
+        required=False,
+        help_text='Título actualizado de la tarea'
+    )
+    description = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        allow_null=True,
+        style={'base_template': 'textarea.html'},
+        help_text='Descripción actualizada de la tarea'
+    )
+    status = serializers.ChoiceField(
+        choices=Task.STATUS_CHOICES,
+        required=False,
+        help_text='Estado actualizado de la tarea'
+    )
+    
     class Meta:
         model = Task
-        fields = [
+        fields = (
             'title',
             'description',
             'status',
-        ]
-        extra_kwargs = {
-            'title': {
-                'required': False,
-                'help_text': 'Título actualizado de la tarea'
-            },
-            'description': {
-                'required': False,
-                'allow_blank': True,
-                'help_text': 'Descripción actualizada de la tarea'
-            },
-            'status': {
-                'required': False,
-                'help_text': 'Estado actualizado de la tarea'
-            }
-        }
-    
-    def validate_title(self, value):
-        """
-        Valida el título para actualización.
-        
-        Args:
-            value (str): El título a validar
-            
-        Returns:
-            str: El título validado
-        """
-        if value is not None:
-            if not value.strip():
-                raise serializers.ValidationError("El título no puede estar vacío.")
-            
-            if len(value.strip()) < 3:
-                raise serializers.ValidationError("El título debe tener al menos 3 caracteres.")
-            
-            if len(value) > 200:
-                raise serializers.ValidationError("El título no puede exceder 200 caracteres.")
-            
-            return value.strip()
-        
-        return value
+        )
     
-    def validate_status(self, value):
-        """
-        Valida el estado para actualización.
-        
-        Args:
-            value (str): El estado a validar
-            
-        Returns:
-            str: El estado validado
-        """
-        if value is not None:
-            valid_statuses = [choice[0] for choice in Task.STATUS_CHOICES]
-            
-            if value not in valid_statuses:
-                raise serializers.ValidationError(
-                    f"Estado inválido. Estados válidos: {', '.join(valid_statuses)}"
-                )
-        
-        return value
+    # Validador de campo compartido (función de módulo, sin enlazar por instancia)
+    validate_title = staticmethod(clean_task_title)
     
     def update(self, instance, validated_data):
         """
@@ -373,21 +488,4 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
         Returns:
             Task: La instancia actualizada
         """
-        # Obtener el estado anterior y nuevo
-        old_status = instance.status
-        new_status = validated_data.get('status', old_status)
-        
-        # Actualizar los campos
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        
-        # Lógica de negocio para completed_at
-        if old_status != 'completada' and new_status == 'completada':
-            # Marcar como completada por primera vez
-            instance.completed_at = timezone.now()
-        elif old_status == 'completada' and new_status != 'completada':
-            # Desmarcar como completada
-            instance.completed_at = None
-        
-        instance.save()
-        return instance
+        return apply_task_update(instance, validated_data)
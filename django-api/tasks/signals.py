@@ -0,0 +1,23 @@
+"""
+Señales de la aplicación de tareas.
+
+Mantienen al día la caché de listados (ver tasks/cache.py) cuando una
+tarea se guarda o se elimina.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_task_list_version
+from .models import Task
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_list_cache(sender, instance, **kwargs):
+    """Invalida los listados cacheados del propietario de la tarea."""
+    user_id = instance.user_id
+    
+    # Invalidar tras el COMMIT, cuando el cambio ya es visible
+    transaction.on_commit(lambda: bump_task_list_version(user_id))
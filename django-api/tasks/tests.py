@@ -1,3 +1,145 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .cache import _version_key, get_task_list_version
+from .models import Task
+
+User = get_user_model()
+
+LIST_URL = '/api/tasks/'
+
+
+class TaskListCacheTests(TestCase):
+    """
+    Invalidación de los listados cacheados por usuario (ver tasks/cache.py).
+
+    Cada prueba carga el listado (lo deja en caché), modifica las tareas
+    por una de las vías que invalidan la caché y vuelve a listar. La
+    invalidación corre en transaction.on_commit, por eso los cambios se
+    hacen dentro de captureOnCommitCallbacks(execute=True).
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        self.user = User.objects.create_user('alice', 'alice@example.com', 'x')
+        self.other = User.objects.create_user('bob', 'bob@example.com', 'x')
+        self.task = Task.objects.create(title='Tarea de alice', user=self.user)
+        self.other_task = Task.objects.create(title='Tarea de bob', user=self.other)
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.other_client = APIClient()
+        self.other_client.force_authenticate(self.other)
+
+    def list_tasks(self, client=None):
+        """Retorna los resultados del listado para el cliente dado."""
+        response = (client or self.client).get(LIST_URL)
+        self.assertEqual(response.status_code, 200)
+        return response.data['results']
+
+    def titles(self, client=None):
+        return [task['title'] for task in self.list_tasks(client)]
+
+    def assert_served_from_cache(self, client):
+        """El listado se responde desde la caché, sin consultas."""
+        with self.assertNumQueries(0):
+            self.list_tasks(client)
+
+    def test_repeated_list_is_served_from_cache(self):
+        self.list_tasks()
+        self.assert_served_from_cache(self.client)
+
+    def test_create_invalidates_list(self):
+        self.assertEqual(self.titles(), ['Tarea de alice'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(LIST_URL, {'title': 'Nueva tarea'}, format='json')
+        self.assertEqual(response.status_code, 201)
+
+        self.assertEqual(self.titles(), ['Nueva tarea', 'Tarea de alice'])
+
+    def test_update_invalidates_list(self):
+        self.list_tasks()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                f'{LIST_URL}{self.task.pk}/', {'title': 'Título nuevo'}, format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.titles(), ['Título nuevo'])
+
+    def test_delete_invalidates_list(self):
+        self.list_tasks()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f'{LIST_URL}{self.task.pk}/')
+        self.assertEqual(response.status_code, 204)
+
+        self.assertEqual(self.list_tasks(), [])
+
+    def test_status_change_invalidates_list(self):
+        self.list_tasks()
+
+        # _set_status escribe con update(), que no emite señales
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(self.task.mark_as_completed())
+
+        [task] = self.list_tasks()
+        self.assertEqual(task['status'], Task.STATUS_COMPLETED)
+        self.assertTrue(task['is_completed'])
+        self.assertIsNotNone(task['completed_at'])
+
+    def test_bulk_change_status_invalidates_every_owner(self):
+        self.list_tasks()
+        self.list_tasks(self.other_client)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            updated = Task.bulk_change_status(Task.objects.all(), Task.STATUS_IN_PROGRESS)
+        self.assertEqual(updated, 2)
+
+        self.assertEqual(self.list_tasks()[0]['status'], Task.STATUS_IN_PROGRESS)
+        self.assertEqual(
+            self.list_tasks(self.other_client)[0]['status'], Task.STATUS_IN_PROGRESS
+        )
+
+    def test_changes_do_not_invalidate_other_users(self):
+        self.list_tasks(self.other_client)
+        other_version = get_task_list_version(self.other.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(LIST_URL, {'title': 'Nueva tarea'}, format='json')
+            self.client.patch(
+                f'{LIST_URL}{self.task.pk}/', {'description': 'Detalle'}, format='json'
+            )
+            self.task.mark_as_in_progress()
+            self.client.delete(f'{LIST_URL}{self.task.pk}/')
+
+        self.assertEqual(get_task_list_version(self.other.pk), other_version)
+        self.assert_served_from_cache(self.other_client)
+        self.assertEqual(self.titles(self.other_client), ['Tarea de bob'])
+
+    def test_version_bumps_only_after_commit(self):
+        version = get_task_list_version(self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.title = 'Título nuevo'
+            self.task.save()
+            # Antes del COMMIT una lectura concurrente vería la tarea
+            # anterior: la versión no debe cambiar todavía
+            self.assertEqual(get_task_list_version(self.user.pk), version)
+
+        self.assertNotEqual(get_task_list_version(self.user.pk), version)
+
+    def test_lost_version_does_not_reuse_cached_pages(self):
+        self.list_tasks()
+
+        # Perder la clave de la versión (p. ej. por desalojo) y cambiar la
+        # tarea sin pasar por las vías que invalidan la caché
+        cache.delete(_version_key(self.user.pk))
+        Task.objects.filter(pk=self.task.pk).update(title='Título nuevo')
+
+        self.assertEqual(self.titles(), ['Título nuevo'])
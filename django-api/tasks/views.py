@@ -6,21 +6,31 @@ las operaciones CRUD de las tareas, con autenticación, permisos
 y optimizaciones de rendimiento.
 """
 
+from datetime import timedelta
+
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.core.cache import cache
+from django.db.models import Count, Q
 from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 
+from .cache import TASK_LIST_CACHE_TIMEOUT, task_list_cache_key, to_cacheable
+from .mixins import DynamicFieldsMixin, EagerLoadingMixin
 from .models import Task
+from .pagination import TaskCursorPagination
 from .serializers import (
     TaskSerializer,
     TaskListSerializer,
     TaskCreateSerializer,
-    TaskUpdateSerializer
+    TaskUpdateSerializer,
+    attach_request_user,
 )
+from .utils import get_status_error
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(EagerLoadingMixin, viewsets.ModelViewSet):
     """
     ViewSet para manejar operaciones CRUD de tareas.
     
@@ -42,21 +52,53 @@ class TaskViewSet(viewsets.ModelViewSet):
     
     permission_classes = [permissions.IsAuthenticated]
     
+    # Acciones que responden con TaskListSerializer
+    LIST_ACTIONS = ('list', 'by_status', 'completed_today')
+    
+    # Serializer por acción (el resto usa TaskSerializer)
+    SERIALIZER_CLASSES = {
+        'list': TaskListSerializer,
+        'by_status': TaskListSerializer,
+        'create': TaskCreateSerializer,
+        'update': TaskUpdateSerializer,
+        'partial_update': TaskUpdateSerializer,
+    }
+    
     def get_queryset(self):
         """
         Retorna el queryset filtrado por el usuario autenticado.
         
         Optimizaciones incluidas:
-        - select_related para evitar N+1 queries
+        - Carga anticipada según el serializer de la acción (EagerLoadingMixin)
+        - Solo las columnas de TaskListSerializer en los listados
         - Filtrado por usuario para seguridad
         - Ordenamiento por defecto
         
         Returns:
             QuerySet: Tareas del usuario autenticado ordenadas por fecha de creación
         """
-        return Task.objects.select_related('user').filter(
-            user=self.request.user
+        queryset = Task.objects.filter(
+            user_id=self.request.user.pk
         ).order_by('-created_at')
+        
+        # by_status y completed_today serializan con TaskListSerializer
+        # aunque get_serializer_class() no lo retorne para esas acciones
+        serializer_class = TaskListSerializer if self.action in self.LIST_ACTIONS else None
+        return self.setup_eager_loading(queryset, serializer_class)
+    
+    def get_object(self):
+        """
+        Retorna la tarea solicitada con su propietario ya asignado.
+        
+        La tarea pertenece a request.user (el queryset está filtrado por
+        usuario), así que se reutiliza ese objeto en lugar de consultarlo.
+        
+        Returns:
+            Task: La tarea del usuario autenticado
+        """
+        task = super().get_object()
+        attach_request_user([task], self.get_serializer_context())
+        return task
     
     def get_serializer_class(self):
         """
@@ -72,13 +114,55 @@ class TaskViewSet(viewsets.ModelViewSet):
         Returns:
             class: Clase del serializer apropiado
         """
-        if self.action == 'list':
-            return TaskListSerializer
-        elif self.action == 'create':
-            return TaskCreateSerializer
-        elif self.action in ['update', 'partial_update']:
-            return TaskUpdateSerializer
-        return TaskSerializer
+        return self.SERIALIZER_CLASSES.get(self.action, TaskSerializer)
+    
+    def get_requested_fields(self):
+        """
+        Campos pedidos con el parámetro ?fields=id,title,status.
+        
+        Returns:
+            list or None: Nombres de campo, o None para todos los campos
+        """
+        request = getattr(self, 'request', None)
+        fields = request.query_params.get('fields') if request is not None else None
+        if not fields:
+            return None
+        return [name.strip() for name in fields.split(',') if name.strip()]
+    
+    def get_serializer(self, *args, **kwargs):
+        """
+        Retorna el serializer de la acción, limitando los campos en listados.
+        
+        Returns:
+            Serializer: Instancia del serializer apropiado
+        """
+        if issubclass(self.get_serializer_class(), DynamicFieldsMixin):
+            kwargs.setdefault('fields', self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+    
+    def list(self, request, *args, **kwargs):
+        """
+        Lista las tareas del usuario, cacheando cada página.
+        
+        La respuesta se guarda como dict/list planos, de modo que un acierto
+        de caché no ejecuta queries ni serializers. Las entradas se invalidan
+        al cambiar las tareas del usuario (ver tasks/cache.py).
+        
+        Args:
+            request: La request del listado
+            
+        Returns:
+            Response: Página de tareas del usuario
+        """
+        cache_key = task_list_cache_key(request)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+        
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(cache_key, to_cacheable(response.data), TASK_LIST_CACHE_TIMEOUT)
+        return response
     
     def perform_create(self, serializer):
         """
@@ -122,6 +206,23 @@ class TaskViewSet(viewsets.ModelViewSet):
         """
         instance.delete()
     
+    def _completed_today_filter(self):
+        """
+        Filtro para tareas completadas en el día actual (zona horaria local).
+        
+        Usa un rango sobre completed_at en lugar de completed_at__date para
+        que la base de datos pueda usar el índice (user, completed_at).
+        
+        Returns:
+            dict: Argumentos para QuerySet.filter()
+        """
+        start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        return {
+            'status': Task.STATUS_COMPLETED,
+            'completed_at__gte': start,
+            'completed_at__lt': start + timedelta(days=1),
+        }
+    
     def _validate_status(self, new_status):
         """
         Helper method to validate task status.
@@ -138,12 +239,10 @@ class TaskViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        valid_statuses = [choice[0] for choice in Task.STATUS_CHOICES]
-        if new_status not in valid_statuses:
+        error = get_status_error(new_status)
+        if error:
             return False, Response(
-                {
-                    'detail': f'Estado inválido. Estados válidos: {", ".join(valid_statuses)}'
-                },
+                {'detail': error},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
@@ -165,7 +264,7 @@ class TaskViewSet(viewsets.ModelViewSet):
             Response: Tarea actualizada o error
         """
         # Reutilizar la lógica de change_status para consistencia
-        request.data['status'] = 'completada'
+        request.data['status'] = Task.STATUS_COMPLETED
         return self.change_status(request)
     
     @action(detail=True, methods=['patch'])
@@ -204,7 +303,25 @@ class TaskViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
     
-    @action(detail=False, methods=['get'])
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                'status',
+                str,
+                required=True,
+                enum=[choice[0] for choice in Task.STATUS_CHOICES],
+                description='Estado a filtrar'
+            ),
+        ],
+        responses=TaskListSerializer(many=True),
+    )
+    @action(
+        detail=False,
+        methods=['get'],
+        pagination_class=TaskCursorPagination,
+        # Sin ?search/?ordering: el cursor usa siempre el orden de la paginación
+        filter_backends=[],
+    )
     def by_status(self, request):
         """
         Acción personalizada para filtrar tareas por estado.
@@ -214,8 +331,15 @@ class TaskViewSet(viewsets.ModelViewSet):
         Parámetros de query:
         - status: Estado a filtrar (pendiente, en_progreso, completada)
         
+        Parámetros de paginación (por cursor, ver TaskCursorPagination):
+        - cursor: Valor tomado de los enlaces next/previous
+        - page_size: Tareas por página (máximo 100)
+        
+        La respuesta es un objeto {next, previous, results}, no una lista:
+        antes de paginar este endpoint retornaba la lista de tareas directa.
+        
         Returns:
-            Response: Lista de tareas filtradas por estado
+            Response: Página de tareas filtradas por estado
         """
         status_filter = request.query_params.get('status')
         
@@ -224,8 +348,14 @@ class TaskViewSet(viewsets.ModelViewSet):
         if not is_valid:
             return error_response
         
+        # Paginado por cursor: memoria y respuesta acotadas, sin COUNT(*)
         queryset = self.get_queryset().filter(status=status_filter)
-        serializer = TaskListSerializer(queryset, many=True)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
+        serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
@@ -238,15 +368,17 @@ class TaskViewSet(viewsets.ModelViewSet):
         Returns:
             Response: Lista de tareas completadas en el día actual
         """
-        today = timezone.now().date()
-        queryset = self.get_queryset().filter(
-            status='completada',
-            completed_at__date=today
+        # Una sola query: el conteo sale de la lista ya cargada
+        tasks = list(self.get_queryset().filter(**self._completed_today_filter()))
+        
+        serializer = TaskListSerializer(
+            tasks,
+            many=True,
+            fields=self.get_requested_fields(),
+            context=self.get_serializer_context(),
         )
-        
-        serializer = TaskListSerializer(queryset, many=True)
         return Response({
-            'count': queryset.count(),
+            'count': len(tasks),
             'tasks': serializer.data
         })
     
@@ -262,16 +394,14 @@ class TaskViewSet(viewsets.ModelViewSet):
         """
         queryset = self.get_queryset()
         
-        stats = {
-            'total': queryset.count(),
-            'pendiente': queryset.filter(status='pendiente').count(),
-            'en_progreso': queryset.filter(status='en_progreso').count(),
-            'completada': queryset.filter(status='completada').count(),
-            'completed_today': queryset.filter(
-                status='completada',
-                completed_at__date=timezone.now().date()
-            ).count(),
-        }
+        # Todos los conteos en una sola query (agregación condicional)
+        stats = queryset.aggregate(
+            total=Count('id'),
+            pendiente=Count('id', filter=Q(status=Task.STATUS_PENDING)),
+            en_progreso=Count('id', filter=Q(status=Task.STATUS_IN_PROGRESS)),
+            completada=Count('id', filter=Q(status=Task.STATUS_COMPLETED)),
+            completed_today=Count('id', filter=Q(**self._completed_today_filter())),
+        )
         
         # Calcular porcentajes
         if stats['total'] > 0:
@@ -0,0 +1,57 @@
+"""Exception handling for todoapi project.
+
+This module contains the project-level DRF exception handler.
+"""
+
+import logging
+
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+logger = logging.getLogger('todoapi')
+
+
+def validation_error_message(message):
+    """Wrap validation errors of a function-based view in an envelope.
+
+    Apply it to a view created with ``@api_view``. Validation errors raised
+    by the view (e.g. ``serializer.is_valid(raise_exception=True)``) are
+    then rendered as ``{'error': message, 'details': <errors>}``.
+    """
+    def decorator(view):
+        view.cls.validation_error_message = message
+        return view
+    return decorator
+
+
+def api_exception_handler(exc, context):
+    """Format every API error as a JSON response.
+
+    Errors DRF already knows how to handle (validation, authentication,
+    404...) keep DRF's default response. Any other exception is logged
+    with its traceback and turned into a generic 500 response, so the
+    views do not need their own ``try/except Exception`` blocks and
+    internal error details are never sent to the client.
+
+    Views marked with ``validation_error_message`` get their validation
+    errors wrapped in the ``{'error': ..., 'details': ...}`` envelope.
+    """
+    response = exception_handler(exc, context)
+    if response is not None:
+        message = getattr(context.get('view'), 'validation_error_message', None)
+        if message and isinstance(exc, ValidationError):
+            response.data = {'error': message, 'details': response.data}
+        return response
+
+    view = context.get('view')
+    logger.error(
+        'Unhandled error in %s',
+        view.__class__.__name__ if view else 'unknown view',
+        exc_info=exc,
+    )
+    return Response(
+        {'error': 'Error interno del servidor'},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
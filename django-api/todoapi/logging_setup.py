@@ -0,0 +1,73 @@
+"""Logging configuration helpers for todoapi project.
+
+Used through the LOGGING_CONFIG setting, so Django applies LOGGING with
+`configure_queued_logging` instead of plain `logging.config.dictConfig`.
+"""
+
+import atexit
+import logging
+import logging.config
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class ProcessLocalQueueHandler(QueueHandler):
+    """QueueHandler whose listener thread runs in the process that logs.
+
+    The listener is started on the first record emitted by each process.
+    Threads do not survive a fork, so a worker forked from a server that
+    loaded the settings first (gunicorn --preload) starts its own listener
+    and a fresh queue instead of feeding one nobody reads.
+    """
+
+    def __init__(self, handlers):
+        super().__init__(queue.SimpleQueue())
+        self.target_handlers = handlers
+        self.listener_pid = None
+
+    def enqueue(self, record):
+        # Called from emit(), under the handler lock (re-created on fork)
+        if self.listener_pid != os.getpid():
+            self.start_listener()
+        super().enqueue(record)
+
+    def start_listener(self):
+        """Start a listener for this process on a new queue."""
+        # Records left in an inherited queue belong to the parent
+        self.queue = queue.SimpleQueue()
+        listener = QueueListener(self.queue, *self.target_handlers, respect_handler_level=True)
+        listener.start()
+        # Flush pending records when the process exits
+        atexit.register(listener.stop)
+        self.listener_pid = os.getpid()
+
+
+def configure_queued_logging(config):
+    """Apply `config` and move its loggers' handlers behind a queue.
+
+    After the regular dictConfig, the handlers of the root logger and of
+    every logger declared in `config` are handed to a QueueListener, which
+    runs them in a background thread. The loggers keep a single
+    QueueHandler, so a log call on the request path only enqueues the
+    record instead of taking the handler locks and writing to the file.
+
+    Loggers with the same handlers share one queue and listener; each
+    handler still applies its own level (respect_handler_level). The
+    listener starts lazily in each process (see ProcessLocalQueueHandler).
+    """
+    logging.config.dictConfig(config)
+
+    loggers = [logging.getLogger()]
+    loggers += [logging.getLogger(name) for name in config.get('loggers', {})]
+
+    queue_handlers = {}
+    for logger in loggers:
+        handlers = tuple(logger.handlers)
+        if not handlers:
+            continue
+
+        if handlers not in queue_handlers:
+            queue_handlers[handlers] = ProcessLocalQueueHandler(handlers)
+
+        logger.handlers = [queue_handlers[handlers]]
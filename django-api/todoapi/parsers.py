@@ -0,0 +1,32 @@
+"""Custom DRF parsers for todoapi project.
+
+This module contains parsers shared by all the apps of the project.
+"""
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+
+class ORJSONParser(JSONParser):
+    """JSON parser backed by orjson.
+
+    Accepts the same media type as DRF's JSONParser and, like its default
+    strict mode, rejects NaN/Infinity, but decodes the body in C.
+    Malformed input still raises ParseError ("JSON parse error - ...").
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse the incoming bytestream as JSON and return the result."""
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            data = stream.read()
+            # orjson only reads UTF-8; other charsets are decoded first
+            if encoding.lower().replace('-', '') != 'utf8':
+                data = data.decode(encoding)
+            return orjson.loads(data)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
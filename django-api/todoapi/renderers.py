@@ -0,0 +1,32 @@
+"""Custom DRF renderers for todoapi project.
+
+This module contains renderers shared by all the apps of the project.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer backed by orjson.
+
+    Produces the same output as DRF's JSONRenderer (compact, UTF-8,
+    with U+2028/U+2029 escaped) but encodes in C. Datetimes and the types
+    orjson does not know natively (lazy translations, Decimal, QuerySet...)
+    are delegated to DRF's JSONEncoder so their format does not change.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render `data` into JSON, returning a bytestring."""
+        if data is None:
+            return b''
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=option)
+
+        # Keep DRF's guarantee that the output is a strict JavaScript subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
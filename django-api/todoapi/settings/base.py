@@ -71,7 +71,7 @@ WSGI_APPLICATION = 'todoapi.wsgi.application'
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
-AUTH_PASSWORD_VALIDATORS = [
+AUTH_PASSWORD_VALIDATORS = (
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
     },
@@ -84,6 +84,19 @@ AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
     },
+)
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/#using-argon2-with-django
+# Argon2 first; PBKDF2 hashes created before the switch are still accepted
+# and upgraded to Argon2 on the user's next successful login.
+PASSWORD_HASHERS = [
+    'authentication.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
 ]
 
 
@@ -107,10 +120,9 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework Configuration
 # https://www.django-rest-framework.org/api-guide/settings/
 REST_FRAMEWORK = {
-    # Authentication classes - JWT will be primary, session for browsable API
+    # Authentication classes - JWT only (development adds session for the browsable API)
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-        'rest_framework.authentication.SessionAuthentication',
+        'authentication.jwt_cache.CachedJWTAuthentication',
     ],
     
     # Permission classes - require authentication by default
@@ -122,15 +134,14 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     
-    # Renderer classes for API responses
+    # Renderer classes for API responses (JSON only; development adds the browsable API)
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
+        'todoapi.renderers.ORJSONRenderer',
     ],
     
     # Parser classes for request data
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'todoapi.parsers.ORJSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ],
@@ -144,6 +155,9 @@ REST_FRAMEWORK = {
     
     # Schema generation for API documentation
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    
+    # Uniform JSON responses for unexpected errors
+    'EXCEPTION_HANDLER': 'todoapi.exceptions.api_exception_handler',
 }
 
 
@@ -156,7 +170,7 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,                   # Generate new refresh token on refresh
     'BLACKLIST_AFTER_ROTATION': True,               # Blacklist old refresh tokens
     
-    # Algorithm and signing
+    # Algorithm and signing (HS256 by default, EdDSA when keys are configured below)
     'ALGORITHM': 'HS256',                            # HMAC using SHA-256 hash algorithm
     'SIGNING_KEY': SECRET_KEY,                       # Use Django's SECRET_KEY for signing
     'VERIFYING_KEY': None,                           # Not needed for symmetric algorithms
@@ -180,3 +194,19 @@ SIMPLE_JWT = {
     # Security settings
     'UPDATE_LAST_LOGIN': True,                       # Update user's last_login field on token refresh
 }
+
+# Optional Ed25519 key pair (PEM, "\n" escapes allowed) to sign tokens with EdDSA.
+# Services that only verify tokens need just the public key.
+# Generate with: openssl genpkey -algorithm ED25519
+JWT_PRIVATE_KEY_PEM = config('JWT_PRIVATE_KEY_PEM', default='').replace('\\n', '\n')
+JWT_PUBLIC_KEY_PEM = config('JWT_PUBLIC_KEY_PEM', default='').replace('\\n', '\n')
+if JWT_PUBLIC_KEY_PEM:
+    SIMPLE_JWT.update({
+        'ALGORITHM': 'EdDSA',                        # Ed25519 signatures (requires cryptography)
+        'SIGNING_KEY': JWT_PRIVATE_KEY_PEM,
+        'VERIFYING_KEY': JWT_PUBLIC_KEY_PEM,
+    })
+
+# In-process cache of validated access tokens (authentication/jwt_cache.py)
+JWT_CACHE_MAX = config('JWT_CACHE_MAX', default=10000, cast=int)  # Max cached tokens per process
+JWT_CACHE_TTL = config('JWT_CACHE_TTL', default=5, cast=int)      # Seconds before re-verifying a token
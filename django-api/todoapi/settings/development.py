@@ -104,19 +104,35 @@ EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 
-# Cache configuration for development (dummy cache)
+# Cache configuration for development (in-process memory, same
+# semantics as the production Redis cache without needing a server)
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'todoapi-dev',
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+            'CULL_FREQUENCY': 4,  # Drop 1/4 of the entries when full
+        },
     }
 }
 
 
 # Development-specific DRF settings
-REST_FRAMEWORK.update({
-    # Enable browsable API for development
+# (a copy: this module is also loaded, through the settings package, when
+# production settings are used, and must not change base's dict)
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    
+    # Session authentication lets the browsable API use the admin login
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'authentication.jwt_cache.CachedJWTAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+    ],
+    
+    # Enable browsable API for development (only while DEBUG is on)
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
+        *REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'],
+        *(['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
     ],
-})
+}
@@ -24,10 +24,24 @@ ALLOWED_HOSTS = config(
 # Use PostgreSQL in production
 DATABASES = {
     'default': dj_database_url.config(
-        default=config('DATABASE_URL')
+        default=config('DATABASE_URL'),
+        # Reuse connections across requests instead of reconnecting each time
+        conn_max_age=config('DB_CONN_MAX_AGE', default=600, cast=int),
+        conn_health_checks=True,  # Discard dropped connections before reuse
     )
 }
 
+# psycopg 3: bind parameters on the server so queries run repeatedly on a
+# connection are prepared once (prepared statements live as long as the
+# connection, see conn_max_age). Set DB_PREPARED_STATEMENTS=False behind
+# PgBouncer in transaction pooling mode, which does not support them.
+if (DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql'
+        and config('DB_PREPARED_STATEMENTS', default=True, cast=bool)):
+    DATABASES['default'].setdefault('OPTIONS', {}).update({
+        'server_side_binding': True,
+        'prepare_threshold': 5,  # Prepare after 5 executions of the same query
+    })
+
 
 # Security settings for production
 SECURE_BROWSER_XSS_FILTER = True
@@ -85,8 +99,17 @@ CORS_PREFLIGHT_MAX_AGE = 86400
 
 
 # Static files configuration for production
+# (served by nginx; collectstatic writes content-hashed names, safe to cache
+# for a year, plus a precompressed .gz copy of each file)
 STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
 
 # Media files configuration for production
 MEDIA_URL = '/media/'
@@ -94,6 +117,11 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 
 # Production logging configuration
+# Handlers run in a background thread fed by a queue (todoapi/logging_setup.py)
+LOG_DIR = BASE_DIR / 'logs'
+LOG_DIR.mkdir(exist_ok=True)  # FileHandler does not create missing directories
+
+LOGGING_CONFIG = 'todoapi.logging_setup.configure_queued_logging'
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -111,7 +139,7 @@ LOGGING = {
         'file': {
             'level': 'INFO',
             'class': 'logging.FileHandler',
-            'filename': BASE_DIR / 'logs' / 'django.log',
+            'filename': LOG_DIR / 'django.log',
             'formatter': 'verbose',
         },
         'console': {
@@ -153,19 +181,17 @@ CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
         'LOCATION': config('REDIS_URL', default='redis://127.0.0.1:6379/1'),
+        # Passed to redis-py's ConnectionPool, which is reused by every
+        # operation of the process; with hiredis installed redis-py parses
+        # replies with its C parser automatically
+        'OPTIONS': {
+            'max_connections': config('REDIS_MAX_CONNECTIONS', default=100, cast=int),
+            'retry_on_timeout': True,
+        },
     }
 }
 
 
-# Production-specific DRF settings
-REST_FRAMEWORK.update({
-    # Disable browsable API in production for security
-    'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-    ],
-})
-
-
 # Session configuration for production
 SESSION_COOKIE_AGE = 3600  # 1 hour
 SESSION_SAVE_EVERY_REQUEST = True
@@ -174,7 +200,3 @@ SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 
 # Additional security headers
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
-
-# Static files configuration for production
-STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'